@@ -430,36 +430,36 @@ class AddWorkflow:
         Returns:
             Dictionary with operation results
         """
-        added_files = []
-        skipped_files = []
-        failed_files = []
+        added_files: List[Path] = []
+        skipped_files: List[Dict[str, str]] = []
+        failed_files: List[Dict[str, Any]] = []
 
+        # Partition first so all spec files can be staged with one git call
+        spec_files: List[Path] = []
         for file_path in file_paths:
-            try:
-                # Validate file is in .specs directory
-                if not self._is_spec_file(file_path):
-                    skipped_files.append(
-                        {"file": str(file_path), "reason": "Not in .specs directory"}
-                    )
-                    continue
-
-                # Add to Git
-                self.git_repo.add_files([str(file_path)])
-                added_files.append(file_path)
-
-                debug_logger.log("INFO", "File added to tracking", file=str(file_path))
+            if self._is_spec_file(file_path):
+                spec_files.append(file_path)
+            else:
+                skipped_files.append(
+                    {"file": str(file_path), "reason": "Not in .specs directory"}
+                )
 
-            except Exception as e:
-                failed_files.append(
-                    {
-                        "file": str(file_path),
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                    }
+        if spec_files:
+            try:
+                self.git_repo.add_files([str(file_path) for file_path in spec_files])
+                added_files.extend(spec_files)
+                debug_logger.log(
+                    "INFO", "Files added to tracking", count=len(spec_files)
                 )
+            except Exception as e:
+                # Retry one by one so the failure is attributed to its file
                 debug_logger.log(
-                    "ERROR", "Failed to add file", file=str(file_path), error=str(e)
+                    "WARNING",
+                    "Batch add failed, adding files individually",
+                    error=str(e),
                 )
+                for file_path in spec_files:
+                    self._add_single_file(file_path, added_files, failed_files)
 
         return {
             "added": added_files,
@@ -468,6 +468,31 @@ class AddWorkflow:
             "success": len(failed_files) == 0,
         }
 
+    def _add_single_file(
+        self,
+        file_path: Path,
+        added_files: List[Path],
+        failed_files: List[Dict[str, Any]],
+    ) -> None:
+        """Add one file to Git, recording it as added or failed."""
+        try:
+            self.git_repo.add_files([str(file_path)])
+            added_files.append(file_path)
+
+            debug_logger.log("INFO", "File added to tracking", file=str(file_path))
+
+        except Exception as e:
+            failed_files.append(
+                {
+                    "file": str(file_path),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                }
+            )
+            debug_logger.log(
+                "ERROR", "Failed to add file", file=str(file_path), error=str(e)
+            )
+
     def _is_spec_file(self, file_path: Path) -> bool:
         """Check if file is in .specs directory."""
         try:
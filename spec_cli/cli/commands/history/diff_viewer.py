@@ -4,9 +4,11 @@ from typing import Any, Dict, List, Optional
 
 from rich.columns import Columns
 from rich.panel import Panel
+from rich.text import Text
 
 from ....logging.debug import debug_logger
 from ....ui.console import get_console
+from .formatters import _NO_DIFF_TEXT
 
 
 class DiffViewer:
@@ -47,17 +49,27 @@ class DiffViewer:
 
     def _display_unified_diff(self, diff_lines: List[str]) -> None:
         """Display unified diff format."""
+        if not diff_lines:
+            return
+
+        # Build the whole diff first and print it in one call. Each line is a
+        # styled Text, so diff content is never parsed as markup and keeps
+        # its emojis (SpecConsole only replaces emojis in plain strings)
+        lines = []
         for line in diff_lines:
             if line.startswith("+++") or line.startswith("---"):
-                self.console.print(f"[bold]{line}[/bold]")
+                style = "bold"
             elif line.startswith("@@"):
-                self.console.print(f"[cyan]{line}[/cyan]")
+                style = "cyan"
             elif line.startswith("+"):
-                self.console.print(f"[green]{line}[/green]")
+                style = "green"
             elif line.startswith("-"):
-                self.console.print(f"[red]{line}[/red]")
+                style = "red"
             else:
-                self.console.print(f"[dim]{line}[/dim]")
+                style = "dim"
+            lines.append(Text(line, style=style))
+
+        self.console.print(Text("\n").join(lines))
 
     def _display_side_by_side_diff(
         self, old_content: str, new_content: str, syntax: str
@@ -164,11 +176,11 @@ class DiffViewer:
         Args:
             context: Additional context for the message
         """
-        message = "No differences found"
-        if context:
-            message += f" {context}"
+        if not context:
+            self.console.print(_NO_DIFF_TEXT)
+            return
 
-        self.console.print(f"[muted]{message}[/muted]")
+        self.console.print(f"[muted]No differences found {context}[/muted]")
 
 
 # Convenience functions
@@ -3,11 +3,20 @@
 from datetime import datetime
 from typing import Any, Dict, List
 
+from rich.text import Text
+
 from ....ui.console import get_console
 
 # DataFormatter not used in this module
 from ....ui.tables import SpecTable
 
+# Style for a diff line keyed by its first character; anything else is dim
+_DIFF_LINE_STYLES = {"+": "green", "-": "red", "@": "cyan"}
+
+# Fixed empty-result messages, parsed from markup once at import
+_NO_COMMITS_TEXT = Text.from_markup("[muted]No commits found[/muted]")
+_NO_DIFF_TEXT = Text.from_markup("[muted]No differences found[/muted]")
+
 
 class GitLogFormatter:
     """Formats Git log output with Rich styling."""
@@ -27,7 +36,7 @@ class GitLogFormatter:
             compact: Whether to use compact format
         """
         if not commits:
-            self.console.print("[muted]No commits found[/muted]")
+            self.console.print(_NO_COMMITS_TEXT)
             return
 
         if compact:
@@ -69,34 +78,49 @@ class GitLogFormatter:
 
     def _format_detailed_log(self, commits: List[Dict[str, Any]]) -> None:
         """Format detailed commit log."""
+        # Collect every commit's lines and print them in one call. Lines are
+        # styled Text objects, so commit text is never parsed as markup and
+        # a stray bracket in one line cannot restyle the lines after it.
+        # Text also skips SpecConsole's emoji replacement, so commit text is
+        # shown exactly as written
+        lines: List[Text] = []
         for i, commit in enumerate(commits):
             if i > 0:
-                self.console.print()  # Separator between commits
+                lines.append(Text())  # Separator between commits
+
+            lines.extend(self._format_single_commit(commit))
 
-            self._format_single_commit(commit)
+        self.console.print(Text("\n").join(lines))
+
+    def _format_single_commit(self, commit: Dict[str, Any]) -> List[Text]:
+        """Format a single commit entry.
+
+        Args:
+            commit: Commit dictionary
 
-    def _format_single_commit(self, commit: Dict[str, Any]) -> None:
-        """Format a single commit entry."""
+        Returns:
+            Styled lines for the commit entry
+        """
         # Commit header
         commit_hash = commit.get("hash", "Unknown")
-        self.console.print(f"[bold yellow]commit {commit_hash}[/bold yellow]")
+        lines = [Text(f"commit {commit_hash}", style="bold yellow")]
 
         # Author and date
         author = commit.get("author", "Unknown")
         date = commit.get("date", "Unknown")
-        self.console.print(f"[cyan]Author:[/cyan] {author}")
-        self.console.print(f"[cyan]Date:[/cyan]   {date}")
+        lines.append(Text.assemble(("Author:", "cyan"), f" {author}"))
+        lines.append(Text.assemble(("Date:", "cyan"), f"   {date}"))
 
         # Message
         message = commit.get("message", "")
-        self.console.print()
+        lines.append(Text())
         for line in message.split("\n"):
-            self.console.print(f"    {line}")
+            lines.append(Text(f"    {line}"))
 
         # File changes if available
         if "files" in commit:
-            self.console.print()
-            self.console.print(f"[dim]Changed files: {len(commit['files'])}[/dim]")
+            lines.append(Text())
+            lines.append(Text(f"Changed files: {len(commit['files'])}", style="dim"))
             for file_info in commit["files"][:5]:  # Show first 5 files
                 status = file_info.get("status", "M")
                 filename = file_info.get("filename", "unknown")
@@ -109,15 +133,20 @@ class GitLogFormatter:
                 else:
                     status_color = "yellow"
 
-                self.console.print(
-                    f"    [{status_color}]{status}[/{status_color}] {filename}"
+                lines.append(
+                    Text.assemble("    ", (status, status_color), f" {filename}")
                 )
 
             if len(commit["files"]) > 5:
-                self.console.print(
-                    f"    [dim]... and {len(commit['files']) - 5} more files[/dim]"
+                lines.append(
+                    Text(
+                        f"    ... and {len(commit['files']) - 5} more files",
+                        style="dim",
+                    )
                 )
 
+        return lines
+
 
 class GitDiffFormatter:
     """Formats Git diff output with Rich styling."""
@@ -132,59 +161,74 @@ class GitDiffFormatter:
             diff_data: Diff data from Git
         """
         if not diff_data or not diff_data.get("files"):
-            self.console.print("[muted]No differences found[/muted]")
+            self.console.print(_NO_DIFF_TEXT)
             return
 
         # Summary header
         files_changed = len(diff_data["files"])
-        self.console.print(
-            f"[bold cyan]Diff Summary: {files_changed} files changed[/bold cyan]\n"
-        )
-
-        # Format each file's diff
+        lines = [
+            Text(f"Diff Summary: {files_changed} files changed", style="bold cyan"),
+            Text(),
+        ]
+
+        # Format each file's diff into one buffer and print it in one call;
+        # as Text, diff content is shown as written (no markup or emoji
+        # replacement)
         for file_diff in diff_data["files"]:
-            self._format_file_diff(file_diff)
+            self._format_file_diff(file_diff, lines)
+
+        self.console.print(Text("\n").join(lines))
 
-    def _format_file_diff(self, file_diff: Dict[str, Any]) -> None:
-        """Format diff for a single file."""
+    def _format_file_diff(self, file_diff: Dict[str, Any], lines: List[Text]) -> None:
+        """Format diff for a single file.
+
+        Args:
+            file_diff: Diff data for one file
+            lines: Output buffer the styled lines are appended to
+        """
         filename = file_diff.get("filename", "unknown")
         status = file_diff.get("status", "modified")
 
         # File header
         if status == "added":
-            self.console.print(f"[bold green]+ {filename}[/bold green] (new file)")
+            lines.append(Text.assemble((f"+ {filename}", "bold green"), " (new file)"))
         elif status == "deleted":
-            self.console.print(f"[bold red]- {filename}[/bold red] (deleted)")
+            lines.append(Text.assemble((f"- {filename}", "bold red"), " (deleted)"))
         else:
-            self.console.print(f"[bold yellow]~ {filename}[/bold yellow] (modified)")
+            lines.append(Text.assemble((f"~ {filename}", "bold yellow"), " (modified)"))
 
         # Diff content
         if "hunks" in file_diff:
             for hunk in file_diff["hunks"]:
-                self._format_diff_hunk(hunk)
+                self._format_diff_hunk(hunk, lines)
 
-        self.console.print()  # Separator
+        lines.append(Text())  # Separator
 
-    def _format_diff_hunk(self, hunk: Dict[str, Any]) -> None:
-        """Format a diff hunk."""
+    def _format_diff_hunk(self, hunk: Dict[str, Any], lines: List[Text]) -> None:
+        """Format a diff hunk.
+
+        Args:
+            hunk: Hunk dictionary with header and lines
+            lines: Output buffer the styled lines are appended to
+        """
         # Hunk header
         header = hunk.get("header", "")
-        self.console.print(f"[bold cyan]{header}[/bold cyan]")
+        lines.append(Text(header, style="bold cyan"))
 
         # Hunk lines
         for line in hunk.get("lines", []):
-            self._format_diff_line(line)
-
-    def _format_diff_line(self, line: str) -> None:
-        """Format a single diff line."""
-        if line.startswith("+"):
-            self.console.print(f"[green]{line}[/green]")
-        elif line.startswith("-"):
-            self.console.print(f"[red]{line}[/red]")
-        elif line.startswith("@"):
-            self.console.print(f"[cyan]{line}[/cyan]")
-        else:
-            self.console.print(f"[dim]{line}[/dim]")
+            lines.append(self._format_diff_line(line))
+
+    def _format_diff_line(self, line: str) -> Text:
+        """Format a single diff line.
+
+        Args:
+            line: Raw diff line
+
+        Returns:
+            The diff line styled by its change type
+        """
+        return Text(line, style=_DIFF_LINE_STYLES.get(line[:1], "dim"))
 
 
 class CommitFormatter:
@@ -212,23 +256,32 @@ class CommitFormatter:
         if "parent" in commit_data:
             table.add_row("Parent", commit_data["parent"][:8])
 
-        table.print()
+        # Tables and text are collected and printed in one call
+        renderables: List[Any] = [table.get_table()]
 
         # Full message if multi-line
         message = commit_data.get("message", "")
         if "\n" in message:
-            self.console.print("\n[bold cyan]Full Message:[/bold cyan]")
-            for line in message.split("\n"):
-                self.console.print(f"  {line}")
+            renderables.append("\n[bold cyan]Full Message:[/bold cyan]")
+            renderables.extend(f"  {line}" for line in message.split("\n"))
 
         # File statistics
         if "stats" in commit_data:
-            self._format_commit_stats(commit_data["stats"])
+            renderables.append("\n[bold cyan]Statistics:[/bold cyan]")
+            stats_table = self._build_commit_stats_table(commit_data["stats"])
+            renderables.append(stats_table.get_table())
+
+        self.console.print(*renderables, sep="\n")
 
-    def _format_commit_stats(self, stats: Dict[str, Any]) -> None:
-        """Format commit statistics."""
-        self.console.print("\n[bold cyan]Statistics:[/bold cyan]")
+    def _build_commit_stats_table(self, stats: Dict[str, Any]) -> SpecTable:
+        """Build the commit statistics table.
 
+        Args:
+            stats: Commit statistics
+
+        Returns:
+            Table with files changed, insertions and deletions
+        """
         stats_table = SpecTable()
         stats_table.add_column("Metric", style="label")
         stats_table.add_column("Count", style="value")
@@ -237,7 +290,7 @@ class CommitFormatter:
         stats_table.add_row("Insertions", f"+{stats.get('insertions', 0)}")
         stats_table.add_row("Deletions", f"-{stats.get('deletions', 0)}")
 
-        stats_table.print()
+        return stats_table
 
 
 # Convenience functions
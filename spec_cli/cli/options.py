@@ -95,24 +95,43 @@ def common_options(f: Callable) -> Callable:
     return f
 
 
-def spec_command(name: Optional[str] = None, **kwargs: Any) -> Callable[..., Any]:
-    """Decorator for spec commands with common setup."""
+def _handle_command_error(error: Exception, command_name: str) -> None:
+    """Report an unexpected command error through the CLI error handler."""
+    from .utils import handle_cli_error
+
+    handle_cli_error(error, f"Command '{command_name}' failed")
+
+
+def spec_command(
+    name: Optional[str] = None, *, handle_errors: bool = True, **kwargs: Any
+) -> Callable[..., Any]:
+    """Decorator for spec commands with common setup.
+
+    Args:
+        name: Optional command name (defaults to the function name)
+        handle_errors: Wrap the command so unexpected exceptions are reported
+            via handle_cli_error. Pass False to register the function as-is.
+        **kwargs: Additional arguments passed to click.command
+    """
 
     def decorator(f: Callable) -> Any:
         # Apply common options
         f_with_options = common_options(f)
 
+        if not handle_errors:
+            return click.command(name, **kwargs)(f_with_options)
+
+        command_name = name or f.__name__
+
         # Add error handling wrapper
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            from .utils import handle_cli_error
-
             try:
                 return f_with_options(*args, **kwargs)
             except click.ClickException:
                 # Re-raise Click exceptions to preserve exit codes
                 raise
             except Exception as e:
-                handle_cli_error(e, f"Command '{name or f.__name__}' failed")
+                _handle_command_error(e, command_name)
 
         # Preserve command metadata
         wrapper = update_wrapper(wrapper, f)
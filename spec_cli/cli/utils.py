@@ -1,6 +1,7 @@
 """CLI utility functions."""
 
 import sys
+from functools import wraps
 from pathlib import Path
 from typing import Any, Callable, List, Optional
 
@@ -173,23 +174,20 @@ def with_progress_context(operation_name: str) -> Callable:
     """
 
     def decorator(f: Callable) -> Callable:
+        operation_id = f"{operation_name}_{id(f)}"
+        description = f"Running {operation_name}..."
+
+        @wraps(f)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             from ..ui.progress_manager import get_progress_manager
 
             progress_manager = get_progress_manager()
-            operation_id = f"{operation_name}_{id(f)}"
-
-            progress_manager.start_indeterminate_operation(
-                operation_id, f"Running {operation_name}..."
-            )
+            progress_manager.start_indeterminate_operation(operation_id, description)
 
             try:
-                result = f(*args, **kwargs)
-                progress_manager.finish_operation(operation_id)
-                return result
-            except Exception:
+                return f(*args, **kwargs)
+            finally:
                 progress_manager.finish_operation(operation_id)
-                raise
 
         return wrapper
 
@@ -51,12 +51,13 @@ class ConfigurationLoader:
                     source_config = self._load_from_file(source)
                     if source_config:
                         config.update(source_config)
-                        debug_logger.log(
-                            "INFO",
-                            "Loaded config from file",
-                            source=str(source),
-                            keys=list(source_config.keys()),
-                        )
+                        if debug_logger.is_enabled_for("INFO"):
+                            debug_logger.log(
+                                "INFO",
+                                "Loaded config from file",
+                                source=str(source),
+                                keys=list(source_config.keys()),
+                            )
                 except Exception as e:
                     raise SpecConfigurationError(
                         f"Failed to load configuration from {source}: {e}",
@@ -1,13 +1,14 @@
 import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
 
 from rich.console import Console
 from rich.theme import Theme
 
 from ..exceptions import SpecConfigurationError
-from ..logging.debug import debug_logger
+from ..logging.debug import _BOOL_FALSE, _BOOL_TRUE, debug_logger
 
 # Rich theme for consistent styling throughout the application
 SPEC_THEME = Theme(
@@ -22,6 +23,47 @@ SPEC_THEME = Theme(
     }
 )
 
+# Environment variable names read by SpecSettings
+_ENV_CACHE_ENV = "SPEC_CACHE_ENV"
+_ENV_CONSOLE_WIDTH = "SPEC_CONSOLE_WIDTH"
+_ENV_DEBUG = "SPEC_DEBUG"
+_ENV_DEBUG_LEVEL = "SPEC_DEBUG_LEVEL"
+_ENV_DEBUG_TIMING = "SPEC_DEBUG_TIMING"
+_ENV_USE_COLOR = "SPEC_USE_COLOR"
+
+# Exact-match lookup for the common spellings, so they skip str.lower()
+_BOOL_FAST = {
+    **dict.fromkeys(_BOOL_TRUE, True),
+    **dict.fromkeys(map(str.upper, _BOOL_TRUE), True),
+    **dict.fromkeys(map(str.capitalize, _BOOL_TRUE), True),
+    **dict.fromkeys(_BOOL_FALSE, False),
+    **dict.fromkeys(map(str.upper, _BOOL_FALSE), False),
+    **dict.fromkeys(map(str.capitalize, _BOOL_FALSE), False),
+}
+
+# Environment mapping used for settings lookups (see _get_environ)
+_ENV_CACHE: Optional[Mapping[str, str]] = None
+
+
+def _get_environ() -> Mapping[str, str]:
+    """Get the environment mapping used for settings lookups.
+
+    When SPEC_CACHE_ENV is enabled, os.environ is snapshotted into a plain
+    dict on first use so repeated reads skip the os.environ encode/decode
+    wrappers. Otherwise the live os.environ mapping is used.
+    """
+    global _ENV_CACHE
+    if _ENV_CACHE is None:
+        cache_env = os.environ.get(_ENV_CACHE_ENV, "").lower() in _BOOL_TRUE
+        _ENV_CACHE = dict(os.environ) if cache_env else os.environ
+    return _ENV_CACHE
+
+
+def refresh_env_cache() -> None:
+    """Discard the environment snapshot so the next lookup re-reads os.environ."""
+    global _ENV_CACHE
+    _ENV_CACHE = None
+
 
 @dataclass
 class SpecSettings:
@@ -38,13 +80,7 @@ class SpecSettings:
     template_file: Path = field(init=False)
     gitignore_file: Path = field(init=False)
 
-    # Debug settings
-    debug_enabled: bool = field(init=False)
-    debug_level: str = field(init=False)
-    debug_timing: bool = field(init=False)
-
     # Terminal styling settings
-    use_color: bool = field(init=False)
     console_width: Optional[int] = field(default=None)
 
     def __post_init__(self) -> None:
@@ -57,14 +93,8 @@ class SpecSettings:
         self.template_file = self.root_path / ".spectemplate"
         self.gitignore_file = self.root_path / ".gitignore"
 
-        # Environment-based settings
-        self.debug_enabled = self._get_bool_env("SPEC_DEBUG", False)
-        self.debug_level = os.environ.get("SPEC_DEBUG_LEVEL", "INFO").upper()
-        self.debug_timing = self._get_bool_env("SPEC_DEBUG_TIMING", False)
-
-        # Terminal settings
-        self.use_color = self._get_bool_env("SPEC_USE_COLOR", True)
-        width_str = os.environ.get("SPEC_CONSOLE_WIDTH")
+        # Terminal settings (debug and color settings are read lazily)
+        width_str = _get_environ().get(_ENV_CONSOLE_WIDTH)
         if width_str:
             try:
                 self.console_width = int(width_str)
@@ -75,31 +105,55 @@ class SpecSettings:
                     "WARNING", "Invalid SPEC_CONSOLE_WIDTH value", value=width_str
                 )
 
-        debug_logger.log(
-            "INFO",
-            "Settings initialized",
-            root_path=str(self.root_path),
-            debug_enabled=self.debug_enabled,
-            use_color=self.use_color,
-        )
+        if debug_logger.is_enabled_for("INFO"):
+            debug_logger.log(
+                "INFO",
+                "Settings initialized",
+                root_path=str(self.root_path),
+                debug_enabled=self.debug_enabled,
+                use_color=self.use_color,
+            )
+
+    # Environment-based settings, resolved on first access and then cached
+
+    @cached_property
+    def debug_enabled(self) -> bool:
+        """Whether debug logging is enabled (SPEC_DEBUG)."""
+        return self._get_bool_env(_ENV_DEBUG, False)
+
+    @cached_property
+    def debug_level(self) -> str:
+        """Debug log level name (SPEC_DEBUG_LEVEL)."""
+        return _get_environ().get(_ENV_DEBUG_LEVEL, "INFO").upper()
+
+    @cached_property
+    def debug_timing(self) -> bool:
+        """Whether performance timing is enabled (SPEC_DEBUG_TIMING)."""
+        return self._get_bool_env(_ENV_DEBUG_TIMING, False)
+
+    @cached_property
+    def use_color(self) -> bool:
+        """Whether Rich output should force terminal colors (SPEC_USE_COLOR)."""
+        return self._get_bool_env(_ENV_USE_COLOR, True)
 
     def _get_bool_env(self, var_name: str, default: bool) -> bool:
         """Get boolean value from environment variable."""
-        value = os.environ.get(var_name, "").lower()
-        if value in ["1", "true", "yes"]:
+        raw_value = _get_environ().get(var_name, "")
+        fast_value = _BOOL_FAST.get(raw_value)
+        if fast_value is not None:
+            return fast_value
+
+        value = raw_value.lower()
+        if value in _BOOL_TRUE:
             return True
-        elif value in ["0", "false", "no"]:
+        elif value in _BOOL_FALSE:
             return False
         return default
 
     def is_initialized(self) -> bool:
         """Check if spec is initialized in the directory."""
-        return (
-            self.spec_dir.exists()
-            and self.spec_dir.is_dir()
-            and self.specs_dir.exists()
-            and self.specs_dir.is_dir()
-        )
+        # is_dir() is False for missing paths, so no separate exists() probe
+        return self.spec_dir.is_dir() and self.specs_dir.is_dir()
 
     def validate_permissions(self) -> None:
         """Validate required permissions for spec operations."""
@@ -125,17 +179,25 @@ class SettingsManager:
     @classmethod
     def get_settings(cls, root_path: Optional[Path] = None) -> SpecSettings:
         """Get global settings instance."""
-        if cls._settings_instance is None or (
-            root_path and root_path != cls._settings_instance.root_path
-        ):
-            cls._settings_instance = SpecSettings(root_path or Path.cwd())
-            # Reset console when settings change
-            cls._console_instance = None
-        return cls._settings_instance
+        # Steady state: one attribute read and no construction
+        instance = cls._settings_instance
+        if instance is not None and (not root_path or root_path == instance.root_path):
+            return instance
+
+        instance = cls._settings_instance = SpecSettings(root_path or Path.cwd())
+        # Reset console when settings change
+        cls._console_instance = None
+        return instance
 
     @classmethod
     def get_console(cls, root_path: Optional[Path] = None) -> Console:
         """Get Rich console instance with spec theming."""
+        # A console only exists alongside settings, so without a root path
+        # override there is nothing to re-check
+        console = cls._console_instance
+        if console is not None and not root_path:
+            return console
+
         settings = cls.get_settings(root_path)
 
         if cls._console_instance is None:
@@ -158,6 +220,7 @@ class SettingsManager:
         """Reset settings and console for testing."""
         cls._settings_instance = None
         cls._console_instance = None
+        refresh_env_cache()
 
 
 # Convenience functions for getting settings and console
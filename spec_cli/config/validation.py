@@ -1,5 +1,6 @@
+import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, FrozenSet, List
 
 from ..exceptions import SpecConfigurationError
 
@@ -7,29 +8,29 @@ from ..exceptions import SpecConfigurationError
 class ConfigurationValidator:
     """Validates configuration values and provides helpful error messages."""
 
+    VALID_DEBUG_LEVELS: ClassVar[FrozenSet[str]] = frozenset(
+        {"DEBUG", "INFO", "WARNING", "ERROR"}
+    )
+    # The same levels in severity order, for messages and schema text
+    VALID_DEBUG_LEVELS_TEXT: ClassVar[str] = ", ".join(
+        sorted(VALID_DEBUG_LEVELS, key=logging.getLevelName)
+    )
+
     def validate_configuration(self, config: Dict[str, Any]) -> List[str]:
         """Validate configuration and return list of validation errors."""
         errors = []
 
-        # Validate debug settings
-        debug_config = config.get("debug", {})
-        if debug_config:
-            errors.extend(self._validate_debug_config(debug_config))
-
-        # Validate terminal settings
-        terminal_config = config.get("terminal", {})
-        if terminal_config:
-            errors.extend(self._validate_terminal_config(terminal_config))
-
-        # Validate path settings
-        path_config = config.get("paths", {})
-        if path_config:
-            errors.extend(self._validate_path_config(path_config))
-
-        # Validate template settings
-        template_config = config.get("template", {})
-        if template_config:
-            errors.extend(self._validate_template_config(template_config))
+        # Configuration section -> validator method, checked in this order
+        section_validators = (
+            ("debug", self._validate_debug_config),
+            ("terminal", self._validate_terminal_config),
+            ("paths", self._validate_path_config),
+            ("template", self._validate_template_config),
+        )
+        for section, validator in section_validators:
+            section_config = config.get(section, {})
+            if section_config:
+                errors.extend(validator(section_config))
 
         return errors
 
@@ -44,9 +45,9 @@ class ConfigurationValidator:
                 errors.append(
                     f"debug.level must be a string, got {type(level).__name__}"
                 )
-            elif level.upper() not in ["DEBUG", "INFO", "WARNING", "ERROR"]:
+            elif level.upper() not in self.VALID_DEBUG_LEVELS:
                 errors.append(
-                    f"Invalid debug level '{level}'. Must be one of: DEBUG, INFO, WARNING, ERROR"
+                    f"Invalid debug level '{level}'. Must be one of: {self.VALID_DEBUG_LEVELS_TEXT}"
                 )
 
         # Check boolean values
@@ -156,7 +157,7 @@ class ConfigurationValidator:
         return {
             "debug": {
                 "enabled": "boolean - Enable debug logging",
-                "level": "string - One of: DEBUG, INFO, WARNING, ERROR",
+                "level": f"string - One of: {self.VALID_DEBUG_LEVELS_TEXT}",
                 "timing": "boolean - Enable timing measurements",
             },
             "terminal": {
@@ -8,6 +8,13 @@ from ..git.repository import SpecGitRepository
 from ..logging.debug import debug_logger
 from .repository_state import RepositoryStateChecker
 
+# Commit hash in "[branch abc1234] message" output from git commit
+_COMMIT_HASH_PATTERN = re.compile(r"\[\w+\s+([a-f0-9]{7,40})\]")
+# Fallback: any full 40-character hash
+_FULL_HASH_PATTERN = re.compile(r"([a-f0-9]{40})")
+# Characters Git does not allow in ref names
+_INVALID_TAG_CHARS_PATTERN = re.compile(r"[\s~^:?*\[\\\x00-\x1f\x7f]")
+
 
 class SpecCommitManager:
     """Manages Git commit operations for spec repository."""
@@ -520,14 +527,12 @@ class SpecCommitManager:
     def _extract_commit_hash(self, git_output: str) -> Optional[str]:
         """Extract commit hash from Git command output."""
         # Look for commit hash patterns in output
-        hash_pattern = r"\[\w+\s+([a-f0-9]{7,40})\]"
-        match = re.search(hash_pattern, git_output)
+        match = _COMMIT_HASH_PATTERN.search(git_output)
         if match:
             return match.group(1)
 
         # Alternative pattern
-        hash_pattern2 = r"([a-f0-9]{40})"
-        match2 = re.search(hash_pattern2, git_output)
+        match2 = _FULL_HASH_PATTERN.search(git_output)
         if match2:
             return match2.group(1)
 
@@ -552,8 +557,7 @@ class SpecCommitManager:
             issues.append("Tag name cannot end with '.lock'")
 
         # Check for invalid characters
-        invalid_chars = r"[\s~^:?*\[\\\x00-\x1f\x7f]"
-        if re.search(invalid_chars, tag_name):
+        if _INVALID_TAG_CHARS_PATTERN.search(tag_name):
             issues.append("Tag name contains invalid characters")
 
         return issues
@@ -367,11 +367,15 @@ class SpecWorkflowOrchestrator:
             auto_commit=auto_commit,
         )
 
+        # Stringify each path once; reused for workflow metadata and results
+        file_path_strs = [str(fp) for fp in file_paths]
+        total_files = len(file_paths)
+
         # Create batch workflow
         workflow = workflow_state_manager.create_workflow(
             "batch_spec_generation",
             {
-                "file_paths": [str(fp) for fp in file_paths],
+                "file_paths": list(file_path_strs),
                 "auto_commit": auto_commit,
                 "create_backup": create_backup,
                 "custom_variables": custom_variables or {},
@@ -385,7 +389,7 @@ class SpecWorkflowOrchestrator:
                 results: Dict[str, Any] = {
                     "success": True,
                     "workflow_id": workflow.workflow_id,
-                    "total_files": len(file_paths),
+                    "total_files": total_files,
                     "successful_files": [],
                     "failed_files": [],
                     "generated_files": {},
@@ -402,11 +406,17 @@ class SpecWorkflowOrchestrator:
                 if create_backup:
                     results["backup_info"] = self._execute_backup_stage(workflow)
 
+                successful_files = results["successful_files"]
+                failed_files = results["failed_files"]
+                generated_files = results["generated_files"]
+
                 # Process each file
-                for i, file_path in enumerate(file_paths):
+                for i, (file_path, file_path_str) in enumerate(
+                    zip(file_paths, file_path_strs)
+                ):
                     if progress_callback:
                         progress_callback(
-                            i, len(file_paths), f"Processing {file_path.name}"
+                            i, total_files, f"Processing {file_path.name}"
                         )
 
                     try:
@@ -417,36 +427,34 @@ class SpecWorkflowOrchestrator:
                             create_backup=False,  # Already created global backup
                         )
 
-                        results["successful_files"].append(str(file_path))
-                        results["generated_files"][str(file_path)] = file_result[
-                            "generated_files"
-                        ]
+                        successful_files.append(file_path_str)
+                        generated_files[file_path_str] = file_result["generated_files"]
 
                     except Exception as e:
                         debug_logger.log(
                             "ERROR",
                             "File processing failed",
-                            file_path=str(file_path),
+                            file_path=file_path_str,
                             error=str(e),
                         )
-                        results["failed_files"].append(
+                        failed_files.append(
                             {
-                                "file_path": str(file_path),
+                                "file_path": file_path_str,
                                 "error": str(e),
                             }
                         )
 
                 # Batch commit if requested and we have successful files
-                if auto_commit and results["successful_files"]:
+                if auto_commit and successful_files:
                     commit_info = self._execute_batch_commit_stage(workflow, results)
                     results["commit_info"] = commit_info
 
                 # Final progress update
                 if progress_callback:
-                    progress_callback(len(file_paths), len(file_paths), "Completed")
+                    progress_callback(total_files, total_files, "Completed")
 
                 # Mark as failed if no files were successful
-                if not results["successful_files"]:
+                if not successful_files:
                     results["success"] = False
 
                 workflow.complete()
@@ -28,11 +28,14 @@ class DirectoryManager:
         )
 
         try:
-            if not specs_dir.exists():
-                specs_dir.mkdir(parents=True, exist_ok=True)
+            # Attempt creation directly; FileExistsError means it is already there
+            try:
+                specs_dir.mkdir(parents=True)
                 debug_logger.log(
                     "INFO", "Created .specs directory", specs_dir=str(specs_dir)
                 )
+            except FileExistsError:
+                pass
 
             # Verify write permissions
             if not os.access(specs_dir, os.W_OK):
@@ -94,13 +97,11 @@ class DirectoryManager:
         )
 
         try:
-            # Ensure parent directories exist
+            # Ensure parent directories exist. mkdir raises FileExistsError
+            # (an OSError) if the path exists but is not a directory.
             spec_dir.mkdir(parents=True, exist_ok=True)
 
-            # Verify the directory was created and is writable
-            if not spec_dir.exists() or not spec_dir.is_dir():
-                raise SpecFileError(f"Failed to create spec directory: {spec_dir}")
-
+            # Verify the directory is writable
             if not os.access(spec_dir, os.W_OK):
                 raise SpecPermissionError(
                     f"No write permission for spec directory: {spec_dir}",
@@ -1,5 +1,6 @@
+import heapq
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from ..exceptions import SpecFileError
 from ..logging.debug import debug_logger
@@ -11,6 +12,8 @@ from .ignore_patterns import IgnorePatternMatcher
 class DirectoryTraversal:
     """Handles intelligent directory traversal with filtering and analysis."""
 
+    _LARGEST_FILES_LIMIT = 5
+
     def __init__(self, root_path: Path):
         self.root_path = root_path
         self.ignore_matcher = IgnorePatternMatcher()
@@ -134,7 +137,9 @@ class DirectoryTraversal:
         try:
             max_depth = 0
             deepest_path = ""
-            files_by_size = []
+            # Bounded min-heap of (size, -order, path) so only the top entries
+            # are retained while walking large trees
+            largest_heap: List[Tuple[int, int, Path]] = []
 
             for file_path in self._walk_directory(directory):
                 analysis["total_files"] += 1
@@ -178,16 +183,19 @@ class DirectoryTraversal:
                 # Track file sizes for largest files
                 try:
                     size = file_path.stat().st_size
-                    files_by_size.append((file_path, size))
                 except OSError:
                     continue
+                entry = (size, -analysis["total_files"], file_path)
+                if len(largest_heap) < self._LARGEST_FILES_LIMIT:
+                    heapq.heappush(largest_heap, entry)
+                else:
+                    heapq.heappushpop(largest_heap, entry)
 
             analysis["max_depth"] = max_depth
             analysis["deepest_path"] = deepest_path
 
             # Get top 5 largest files
-            files_by_size.sort(key=lambda x: x[1], reverse=True)
-            for file_path, size in files_by_size[:5]:
+            for size, _, file_path in sorted(largest_heap, reverse=True):
                 try:
                     relative_path = file_path.relative_to(directory)
                     analysis["largest_files"].append(
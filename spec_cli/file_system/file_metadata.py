@@ -32,10 +32,11 @@ class FileMetadataExtractor:
             if not file_path.is_absolute():
                 file_path = file_path.resolve()
 
-            if not file_path.exists():
-                raise SpecFileError(f"File does not exist: {file_path}")
-
-            stat_info = file_path.stat()
+            # A single stat call doubles as the existence check
+            try:
+                stat_info = file_path.stat()
+            except FileNotFoundError:
+                raise SpecFileError(f"File does not exist: {file_path}") from None
 
             # Basic file information
             metadata = {
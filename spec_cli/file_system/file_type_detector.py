@@ -131,6 +131,45 @@ class FileTypeDetector:
         ".sqlite3",
     }
 
+    # Broader category for each specific file type
+    FILE_CATEGORIES = {
+        # Programming languages
+        "python": "programming",
+        "javascript": "programming",
+        "typescript": "programming",
+        "java": "programming",
+        "c": "programming",
+        "cpp": "programming",
+        "rust": "programming",
+        "go": "programming",
+        "ruby": "programming",
+        "php": "programming",
+        "swift": "programming",
+        "kotlin": "programming",
+        "scala": "programming",
+        "csharp": "programming",
+        "visualbasic": "programming",
+        # Web technologies
+        "html": "web",
+        "css": "web",
+        "xml": "web",
+        # Data and config
+        "json": "data",
+        "yaml": "data",
+        "toml": "data",
+        "csv": "data",
+        "sql": "data",
+        "config": "configuration",
+        "environment": "configuration",
+        # Documentation
+        "markdown": "documentation",
+        "restructuredtext": "documentation",
+        "text": "documentation",
+        "documentation": "documentation",
+        # Build systems
+        "build": "build",
+    }
+
     # Maximum file size for processing (1MB)
     MAX_FILE_SIZE = 1_048_576
 
@@ -146,13 +185,14 @@ class FileTypeDetector:
         extension = file_path.suffix.lower()
         filename = file_path.name.lower()
 
-        debug_logger.log(
-            "DEBUG",
-            "Analyzing file type",
-            file_path=str(file_path),
-            extension=extension,
-            filename=filename,
-        )
+        if debug_logger.is_enabled_for("DEBUG"):
+            debug_logger.log(
+                "DEBUG",
+                "Analyzing file type",
+                file_path=str(file_path),
+                extension=extension,
+                filename=filename,
+            )
 
         # Check special filenames first (higher priority)
         if filename in self.SPECIAL_FILENAMES:
@@ -222,16 +262,21 @@ class FileTypeDetector:
             )
             return False
 
-        # Check file size (skip very large files)
+        # Check file size (skip very large files). One stat call covers both
+        # the existence check and the size lookup.
         try:
-            if file_path.exists() and file_path.stat().st_size > self.MAX_FILE_SIZE:
+            file_size = file_path.stat().st_size
+            if file_size > self.MAX_FILE_SIZE:
                 debug_logger.log(
                     "DEBUG",
                     "File skipped - too large",
                     file_path=str(file_path),
-                    size=file_path.stat().st_size,
+                    size=file_size,
                 )
                 return False
+        except (FileNotFoundError, NotADirectoryError):
+            # Nonexistent paths are judged on their name alone
+            pass
         except OSError as e:
             debug_logger.log(
                 "WARNING",
@@ -268,43 +313,4 @@ class FileTypeDetector:
         """
         file_type = self.get_file_type(file_path)
 
-        # Map specific types to broader categories
-        category_mapping = {
-            # Programming languages
-            "python": "programming",
-            "javascript": "programming",
-            "typescript": "programming",
-            "java": "programming",
-            "c": "programming",
-            "cpp": "programming",
-            "rust": "programming",
-            "go": "programming",
-            "ruby": "programming",
-            "php": "programming",
-            "swift": "programming",
-            "kotlin": "programming",
-            "scala": "programming",
-            "csharp": "programming",
-            "visualbasic": "programming",
-            # Web technologies
-            "html": "web",
-            "css": "web",
-            "xml": "web",
-            # Data and config
-            "json": "data",
-            "yaml": "data",
-            "toml": "data",
-            "csv": "data",
-            "sql": "data",
-            "config": "configuration",
-            "environment": "configuration",
-            # Documentation
-            "markdown": "documentation",
-            "restructuredtext": "documentation",
-            "text": "documentation",
-            "documentation": "documentation",
-            # Build systems
-            "build": "build",
-        }
-
-        return category_mapping.get(file_type)
+        return self.FILE_CATEGORIES.get(file_type)
@@ -1,11 +1,16 @@
+import heapq
 import os
+import stat
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from ..exceptions import SpecFileError
 from ..logging.debug import debug_logger
 
+# os.access() modes for safe_file_operation
+_ACCESS_MODES = {"read": os.R_OK, "write": os.W_OK, "execute": os.X_OK}
+
 
 def ensure_file_readable(file_path: Path) -> bool:
     """Ensure a file is readable, with helpful error reporting.
@@ -16,11 +21,20 @@ def ensure_file_readable(file_path: Path) -> bool:
     Returns:
         True if readable, False otherwise
     """
-    if not file_path.exists():
+    # A single stat call answers both "exists" and "is a regular file"
+    try:
+        st = file_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         debug_logger.log("WARNING", "File does not exist", file_path=str(file_path))
         return False
+    except OSError as e:
+        # Symlink loops, unreadable parent directories and the like
+        debug_logger.log(
+            "WARNING", "Cannot access file", file_path=str(file_path), error=str(e)
+        )
+        return False
 
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         debug_logger.log(
             "WARNING", "Path is not a regular file", file_path=str(file_path)
         )
@@ -74,28 +88,17 @@ def find_largest_files(directory: Path, limit: int = 10) -> List[Dict[str, objec
     if not directory.is_dir():
         raise SpecFileError(f"Path is not a directory: {directory}")
 
-    files_with_size = []
-
     try:
-        for file_path in directory.rglob("*"):
-            if file_path.is_file():
-                try:
-                    size = file_path.stat().st_size
-                    files_with_size.append(
-                        {
-                            "path": file_path,
-                            "size": size,
-                            "size_formatted": format_file_size(size),
-                        }
-                    )
-                except OSError:
-                    continue
-
-        # Sort by size (largest first) and return top N
-        files_with_size.sort(
-            key=lambda x: x["size"] if isinstance(x["size"], int) else 0, reverse=True
+        # Keep only the top N (path, size) pairs instead of materializing
+        # an entry for every file in the tree
+        sizes = (
+            (file_path, st.st_size) for file_path, st in _iter_file_stats(directory)
         )
-        return files_with_size[:limit]
+        largest = heapq.nlargest(limit, sizes, key=lambda x: x[1])
+        return [
+            {"path": file_path, "size": size, "size_formatted": format_file_size(size)}
+            for file_path, size in largest
+        ]
 
     except OSError as e:
         raise SpecFileError(f"Cannot search directory {directory}: {e}") from e
@@ -116,36 +119,41 @@ def find_recently_modified_files(
     if not directory.is_dir():
         raise SpecFileError(f"Path is not a directory: {directory}")
 
-    files_with_time = []
-
     try:
-        for file_path in directory.rglob("*"):
-            if file_path.is_file():
-                try:
-                    mtime = file_path.stat().st_mtime
-                    files_with_time.append(
-                        {
-                            "path": file_path,
-                            "modified_time": mtime,
-                            "modified_formatted": format_timestamp(mtime),
-                        }
-                    )
-                except OSError:
-                    continue
-
-        # Sort by modification time (newest first) and return top N
-        files_with_time.sort(
-            key=lambda x: x["modified_time"]
-            if isinstance(x["modified_time"], (int, float))
-            else 0,
-            reverse=True,
+        mtimes = (
+            (file_path, st.st_mtime) for file_path, st in _iter_file_stats(directory)
         )
-        return files_with_time[:limit]
+        newest = heapq.nlargest(limit, mtimes, key=lambda x: x[1])
+        return [
+            {
+                "path": file_path,
+                "modified_time": mtime,
+                "modified_formatted": format_timestamp(mtime),
+            }
+            for file_path, mtime in newest
+        ]
 
     except OSError as e:
         raise SpecFileError(f"Cannot search directory {directory}: {e}") from e
 
 
+def _iter_file_stats(directory: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+    """Yield (path, stat result) pairs for every regular file under a directory.
+
+    Args:
+        directory: Directory to search
+
+    Yields:
+        Tuples of file path and its os.stat_result
+    """
+    for file_path in directory.rglob("*"):
+        if file_path.is_file():
+            try:
+                yield file_path, file_path.stat()
+            except OSError:
+                continue
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format.
 
@@ -186,17 +194,15 @@ def safe_file_operation(file_path: Path, operation: str) -> bool:
     Returns:
         True if operation is safe, False otherwise
     """
-    if not file_path.exists():
-        return False
-
-    operation_map = {"read": os.R_OK, "write": os.W_OK, "execute": os.X_OK}
-
-    if operation not in operation_map:
+    mode = _ACCESS_MODES.get(operation)
+    if mode is None:
         debug_logger.log("ERROR", "Unknown file operation", operation=operation)
         return False
 
+    # os.access() already returns False for missing paths, so there is no
+    # separate exists() probe
     try:
-        return os.access(file_path, operation_map[operation])
+        return os.access(file_path, mode)
     except OSError as e:
         debug_logger.log(
             "ERROR",
@@ -175,19 +175,23 @@ class IgnorePatternMatcher:
         if path_str.startswith("./"):
             path_str = path_str[2:]
 
-        debug_logger.log("DEBUG", "Checking ignore patterns", file_path=path_str)
+        # Resolve once: this runs per file during traversal
+        log_debug = debug_logger.is_enabled_for("DEBUG")
+        if log_debug:
+            debug_logger.log("DEBUG", "Checking ignore patterns", file_path=path_str)
 
         # Check if any ignore pattern matches
         ignored = False
         for pattern in self.patterns:
             if pattern.search(path_str):
                 ignored = True
-                debug_logger.log(
-                    "DEBUG",
-                    "File matched ignore pattern",
-                    file_path=path_str,
-                    pattern=pattern.pattern,
-                )
+                if log_debug:
+                    debug_logger.log(
+                        "DEBUG",
+                        "File matched ignore pattern",
+                        file_path=path_str,
+                        pattern=pattern.pattern,
+                    )
                 break
 
         # Check negation patterns (! patterns override ignore)
@@ -195,17 +199,22 @@ class IgnorePatternMatcher:
             for neg_pattern in self.negation_patterns:
                 if neg_pattern.search(path_str):
                     ignored = False
-                    debug_logger.log(
-                        "DEBUG",
-                        "File matched negation pattern",
-                        file_path=path_str,
-                        pattern=neg_pattern.pattern,
-                    )
+                    if log_debug:
+                        debug_logger.log(
+                            "DEBUG",
+                            "File matched negation pattern",
+                            file_path=path_str,
+                            pattern=neg_pattern.pattern,
+                        )
                     break
 
-        debug_logger.log(
-            "DEBUG", "Ignore check result", file_path=path_str, should_ignore=ignored
-        )
+        if log_debug:
+            debug_logger.log(
+                "DEBUG",
+                "Ignore check result",
+                file_path=path_str,
+                should_ignore=ignored,
+            )
 
         return ignored
 
@@ -1,5 +1,6 @@
+import os
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from ..config.settings import SpecSettings, get_settings
 from ..exceptions import SpecFileError, SpecValidationError
@@ -7,6 +8,18 @@ from ..logging.debug import debug_logger
 from .path_utils import remove_specs_prefix
 
 
+def _resolve(path: Path) -> Path:
+    """Resolve symlinks in a path without Path.resolve() overhead.
+
+    Args:
+        path: Path to resolve
+
+    Returns:
+        Absolute path with symlinks resolved
+    """
+    return Path(os.path.realpath(path))
+
+
 class PathResolver:
     """Handles path resolution and validation for spec operations.
 
@@ -16,6 +29,21 @@ class PathResolver:
 
     def __init__(self, settings: Optional[SpecSettings] = None):
         self.settings = settings or get_settings()
+        # (root_path, resolved root) for the last root seen
+        self._resolved_root_cache: Optional[Tuple[Path, Path]] = None
+
+    def _get_resolved_root(self) -> Path:
+        """Get the resolved project root, resolving it once per root path.
+
+        Returns:
+            Project root with symlinks resolved
+        """
+        root_path = self.settings.root_path
+        cached = self._resolved_root_cache
+        if cached is None or cached[0] != root_path:
+            cached = (root_path, _resolve(root_path))
+            self._resolved_root_cache = cached
+        return cached[1]
 
     def resolve_input_path(self, path_str: str) -> Path:
         """Resolve and validate an input path for spec operations.
@@ -52,23 +80,27 @@ class PathResolver:
                     return self._ensure_within_project(input_path)
 
                 # Handle relative paths - resolve relative to current working directory
-                resolved_path = (Path.cwd() / input_path).resolve()
+                resolved_path = _resolve(Path.cwd() / input_path)
                 debug_logger.log(
                     "INFO",
                     "Processing relative path",
                     original=path_str,
                     resolved=str(resolved_path),
                 )
-                return self._ensure_within_project(resolved_path)
+                return self._ensure_within_project(resolved_path, resolved=True)
 
             except OSError as e:
                 raise SpecFileError(f"Failed to resolve path '{path_str}': {e}") from e
 
-    def _ensure_within_project(self, absolute_path: Path) -> Path:
+    def _ensure_within_project(
+        self, absolute_path: Path, resolved: bool = False
+    ) -> Path:
         """Ensure path is within project boundaries and return relative path.
 
         Args:
             absolute_path: Absolute path to validate
+            resolved: Whether absolute_path has already been resolved, in
+                which case it is not resolved again
 
         Returns:
             Path relative to project root
@@ -78,8 +110,8 @@ class PathResolver:
         """
         try:
             # Resolve both paths to handle symlinks consistently
-            resolved_absolute = absolute_path.resolve()
-            resolved_root = self.settings.root_path.resolve()
+            resolved_absolute = absolute_path if resolved else _resolve(absolute_path)
+            resolved_root = self._get_resolved_root()
 
             relative_path = resolved_absolute.relative_to(resolved_root)
             debug_logger.log(
@@ -180,15 +212,17 @@ class PathResolver:
         Returns:
             True if path is within project boundaries
         """
-        try:
-            if path.is_absolute():
-                # Resolve both paths to handle symlinks consistently
-                resolved_path = path.resolve()
-                resolved_root = self.settings.root_path.resolve()
-                resolved_path.relative_to(resolved_root)
+        if not path.is_absolute():
+            return True
+
+        # Resolve both paths to handle symlinks consistently, then answer the
+        # containment question with a string prefix check instead of
+        # building relative_to() part tuples
+        resolved_path = os.path.normcase(os.path.realpath(path))
+        resolved_root = os.path.normcase(str(self._get_resolved_root()))
+        if resolved_path == resolved_root:
             return True
-        except ValueError:
-            return False
+        return resolved_path.startswith(resolved_root.rstrip(os.sep) + os.sep)
 
     def get_absolute_path(self, relative_path: Path) -> Path:
         """Convert relative path to absolute path within project.
@@ -8,6 +8,9 @@ and proper prefix handling for .specs/ directories.
 from pathlib import Path
 from typing import Union
 
+_SPECS_PREFIXES = (".specs/", ".specs\\")
+_SPECS_PREFIX_LEN = len(".specs/")
+
 
 def normalize_path_separators(path: Union[str, Path]) -> str:
     """Normalize path separators to forward slashes for cross-platform consistency.
@@ -24,7 +27,11 @@ def normalize_path_separators(path: Union[str, Path]) -> str:
         >>> normalize_path_separators(Path("src/models/user.py"))
         'src/models/user.py'
     """
-    return str(path).replace("\\", "/")
+    path_str = str(path)
+    # Common case on POSIX: nothing to replace, return the string as-is
+    if "\\" not in path_str:
+        return path_str
+    return path_str.replace("\\", "/")
 
 
 def remove_specs_prefix(path_str: str) -> str:
@@ -44,17 +51,14 @@ def remove_specs_prefix(path_str: str) -> str:
         >>> remove_specs_prefix("src/models/user.py")
         'src/models/user.py'
     """
-    # Handle both Unix and Windows style .specs prefixes
-    specs_prefixes = [".specs/", ".specs\\"]
-
-    for prefix in specs_prefixes:
-        if path_str.startswith(prefix):
-            # Remove prefix and normalize remaining path
-            cleaned_path = path_str[len(prefix) :]
-            return normalize_path_separators(cleaned_path)
+    # Handle both Unix and Windows style .specs prefixes (same length)
+    if path_str.startswith(_SPECS_PREFIXES):
+        path_str = path_str[_SPECS_PREFIX_LEN:]
 
-    # No .specs prefix found, just normalize separators
-    return normalize_path_separators(path_str)
+    # Common case on POSIX: nothing to normalize, return the string as-is
+    if "\\" not in path_str:
+        return path_str
+    return path_str.replace("\\", "/")
 
 
 def ensure_specs_prefix(path: Union[str, Path]) -> str:
@@ -80,9 +84,9 @@ def ensure_specs_prefix(path: Union[str, Path]) -> str:
     if normalized_path.startswith(".specs/"):
         return normalized_path
 
-    # Remove any existing .specs prefix variants and add normalized one
-    cleaned_path = remove_specs_prefix(normalized_path)
-    return f".specs/{cleaned_path}"
+    # Separators are already normalized, so no ".specs\\" variant can remain
+    # and the path can be prefixed without another remove/normalize pass
+    return f".specs/{normalized_path}"
 
 
 def is_specs_path(path: Union[str, Path]) -> bool:
@@ -2,7 +2,7 @@ import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Union
 
 if sys.version_info >= (3, 9):
     from subprocess import CompletedProcess
@@ -13,6 +13,52 @@ else:
 from ..exceptions import SpecGitError
 from ..logging.debug import debug_logger
 
+# Leading arguments for every spec Git invocation
+_GIT_COMMAND_PREFIX = (
+    "git",
+    # Disable global excludes file to prevent interference
+    "-c",
+    "core.excludesFile=",
+    # Ensure case sensitivity for cross-platform compatibility
+    "-c",
+    "core.ignoreCase=false",
+)
+
+
+def _format_command(cmd: Union[str, Sequence[str]]) -> str:
+    """Render a process command for logs and error messages.
+
+    Args:
+        cmd: Command as an argument list/tuple or a single string
+
+    Returns:
+        Space-joined command string
+    """
+    return " ".join(cmd) if isinstance(cmd, (list, tuple)) else str(cmd)
+
+
+def _format_process_error(
+    summary: str,
+    error: subprocess.CalledProcessError,
+    include_stdout: bool = True,
+) -> str:
+    """Build an error message from a failed process and its captured output.
+
+    Args:
+        summary: First line of the message
+        error: The failed process error
+        include_stdout: Whether to append captured stdout
+
+    Returns:
+        Newline-joined error message
+    """
+    parts = [summary]
+    if error.stderr:
+        parts.append(f"Stderr: {error.stderr}")
+    if include_stdout and error.stdout:
+        parts.append(f"Stdout: {error.stdout}")
+    return "\n".join(parts)
+
 
 class GitOperations:
     """Handles low-level Git command execution with spec environment configuration."""
@@ -47,11 +93,12 @@ class GitOperations:
         """
         env = self._prepare_git_environment()
         cmd = self._prepare_git_command(args)
+        command_str = _format_command(cmd)
 
         debug_logger.log(
             "INFO",
             "Executing Git command",
-            command=" ".join(cmd),
+            command=command_str,
             git_dir=str(self.spec_dir),
             work_tree=str(self.specs_dir),
         )
@@ -77,16 +124,12 @@ class GitOperations:
             return result
 
         except subprocess.CalledProcessError as e:
-            error_msg = f"Git command failed: {' '.join(cmd)}"
-            if e.stderr:
-                error_msg += f"\nStderr: {e.stderr}"
-            if e.stdout:
-                error_msg += f"\nStdout: {e.stdout}"
+            error_msg = _format_process_error(f"Git command failed: {command_str}", e)
 
             debug_logger.log(
                 "ERROR",
                 "Git command failed",
-                command=" ".join(cmd),
+                command=command_str,
                 return_code=e.returncode,
                 error=error_msg,
             )
@@ -120,7 +163,8 @@ class GitOperations:
 
         env.update(git_env)
 
-        debug_logger.log("DEBUG", "Git environment prepared", **git_env)
+        if debug_logger.is_enabled_for("DEBUG"):
+            debug_logger.log("DEBUG", "Git environment prepared", **git_env)
 
         return env
 
@@ -133,22 +177,13 @@ class GitOperations:
         Returns:
             Complete command list
         """
-        cmd = [
-            "git",
-            # Disable global excludes file to prevent interference
-            "-c",
-            "core.excludesFile=",
-            # Ensure case sensitivity for cross-platform compatibility
-            "-c",
-            "core.ignoreCase=false",
-        ]
-
-        # Add the actual command arguments
-        cmd.extend(args)
+        # Fixed prefix plus the actual command arguments, built in one step
+        cmd = [*_GIT_COMMAND_PREFIX, *args]
 
-        debug_logger.log(
-            "DEBUG", "Git command prepared", original_args=args, full_command=cmd
-        )
+        if debug_logger.is_enabled_for("DEBUG"):
+            debug_logger.log(
+                "DEBUG", "Git command prepared", original_args=args, full_command=cmd
+            )
 
         return cmd
 
@@ -179,9 +214,9 @@ class GitOperations:
             )
 
         except subprocess.CalledProcessError as e:
-            error_msg = f"Failed to initialize Git repository: {e}"
-            if e.stderr:
-                error_msg += f"\nStderr: {e.stderr}"
+            error_msg = _format_process_error(
+                f"Failed to initialize Git repository: {e}", e, include_stdout=False
+            )
             debug_logger.log("ERROR", error_msg)
             raise SpecGitError(error_msg) from e
 
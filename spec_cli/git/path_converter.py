@@ -1,5 +1,6 @@
+import os
 from pathlib import Path
-from typing import Union
+from typing import Iterable, List, Union
 
 from ..file_system.path_utils import normalize_path_separators, remove_specs_prefix
 from ..logging.debug import debug_logger
@@ -23,10 +24,28 @@ class GitPathConverter:
         Returns:
             Path relative to Git work tree
         """
-        path_obj = Path(path)
         path_str = str(path)
+        log_debug = debug_logger.is_enabled_for("DEBUG")
 
-        debug_logger.log("DEBUG", "Converting path to Git context", input_path=path_str)
+        if log_debug:
+            debug_logger.log(
+                "DEBUG", "Converting path to Git context", input_path=path_str
+            )
+
+        # Handle .specs/ or .specs\ prefixed paths first: they are the most
+        # common input, can never be absolute, and need no Path object
+        if path_str.startswith((".specs/", ".specs\\")):
+            result = remove_specs_prefix(path_str)
+            if log_debug:
+                debug_logger.log(
+                    "DEBUG",
+                    "Removed .specs prefix (cross-platform)",
+                    original=path_str,
+                    result=result,
+                )
+            return result
+
+        path_obj = path if isinstance(path, Path) else Path(path)
 
         # Handle absolute paths
         if path_obj.is_absolute():
@@ -34,42 +53,64 @@ class GitPathConverter:
                 # Try to make it relative to .specs/ directory
                 relative_path = path_obj.relative_to(self.specs_dir)
                 result = normalize_path_separators(relative_path)
-                debug_logger.log(
-                    "DEBUG",
-                    "Converted absolute path",
-                    absolute=path_str,
-                    relative=result,
-                )
+                if log_debug:
+                    debug_logger.log(
+                        "DEBUG",
+                        "Converted absolute path",
+                        absolute=path_str,
+                        relative=result,
+                    )
                 return result
             except ValueError:
                 # Path is not under .specs/, return as-is
-                debug_logger.log(
-                    "DEBUG",
-                    "Absolute path not under .specs/, returning as-is",
-                    path=path_str,
-                )
+                if log_debug:
+                    debug_logger.log(
+                        "DEBUG",
+                        "Absolute path not under .specs/, returning as-is",
+                        path=path_str,
+                    )
                 return path_str
 
-        # Handle .specs/ or .specs\ prefixed paths using cross-platform utility
-        if path_str.startswith((".specs/", ".specs\\")):
-            result = remove_specs_prefix(path_str)
+        # Path is already relative, return as-is (but normalize separators)
+        result = normalize_path_separators(path_obj)
+        if log_debug:
             debug_logger.log(
                 "DEBUG",
-                "Removed .specs prefix (cross-platform)",
+                "Path already relative, normalized separators",
                 original=path_str,
                 result=result,
             )
-            return result
+        return result
 
-        # Path is already relative, return as-is (but normalize separators)
-        result = normalize_path_separators(path_obj)
+    def convert_to_git_paths(self, paths: Iterable[Union[str, Path]]) -> List[str]:
+        """Convert a batch of paths to be relative to the Git work tree.
+
+        Args:
+            paths: Paths to convert (absolute, relative, or .specs/ prefixed)
+
+        Returns:
+            Paths relative to Git work tree, in input order
+        """
+        # Absolute paths under .specs/ are answered with one string prefix
+        # check against a root computed once, instead of a Path plus
+        # relative_to() per path; everything else takes the general route
+        specs_prefix = os.path.join(str(self.specs_dir), "")
+        prefix_len = len(specs_prefix)
+        converted = []
+        for path in paths:
+            path_str = str(path)
+            if path_str.startswith(specs_prefix):
+                converted.append(
+                    normalize_path_separators(
+                        os.path.normpath(path_str[prefix_len:].lstrip(os.sep))
+                    )
+                )
+            else:
+                converted.append(self.convert_to_git_path(path))
         debug_logger.log(
-            "DEBUG",
-            "Path already relative, normalized separators",
-            original=path_str,
-            result=result,
+            "DEBUG", "Converted paths to Git context", path_count=len(converted)
         )
-        return result
+        return converted
 
     def convert_from_git_path(self, git_path: Union[str, Path]) -> Path:
         """Convert path from Git work tree context to .specs/ prefixed path.
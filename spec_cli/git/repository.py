@@ -1,3 +1,5 @@
+import os
+import stat
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -110,16 +112,7 @@ class SpecGitRepository(GitRepository):
         )
 
         # Convert paths to Git work tree context
-        converted_paths = []
-        for path in paths:
-            converted_path = self.path_converter.convert_to_git_path(path)
-            converted_paths.append(converted_path)
-            debug_logger.log(
-                "DEBUG",
-                "Path conversion for add",
-                original=path,
-                converted=converted_path,
-            )
+        converted_paths = self.path_converter.convert_to_git_paths(paths)
 
         # Add files with force flag to bypass ignore rules
         git_args = ["add", "-f"] + converted_paths
@@ -178,9 +171,7 @@ class SpecGitRepository(GitRepository):
 
         if paths:
             # Convert paths to Git work tree context
-            converted_paths = [
-                self.path_converter.convert_to_git_path(path) for path in paths
-            ]
+            converted_paths = self.path_converter.convert_to_git_paths(paths)
             git_args.extend(["--"] + converted_paths)
             debug_logger.log(
                 "DEBUG",
@@ -205,9 +196,7 @@ class SpecGitRepository(GitRepository):
 
         if paths:
             # Convert paths to Git work tree context
-            converted_paths = [
-                self.path_converter.convert_to_git_path(path) for path in paths
-            ]
+            converted_paths = self.path_converter.convert_to_git_paths(paths)
             git_args.extend(["--"] + converted_paths)
             debug_logger.log(
                 "DEBUG",
@@ -224,17 +213,15 @@ class SpecGitRepository(GitRepository):
         Returns:
             True if .spec directory exists and is a valid Git repository
         """
-        if not self.settings.spec_dir.exists():
-            debug_logger.log("DEBUG", "Spec directory does not exist")
-            return False
-
-        if not self.settings.spec_dir.is_dir():
-            debug_logger.log("DEBUG", "Spec directory is not a directory")
+        # A single stat of .spec/objects answers "spec dir exists", "is a
+        # directory" and "has Git objects"; permission errors still surface
+        try:
+            objects_stat = os.stat(self.settings.spec_dir / "objects")
+        except (FileNotFoundError, NotADirectoryError):
+            debug_logger.log("DEBUG", "Spec repository objects directory not found")
             return False
 
-        # Check if it's a valid Git repository by looking for Git objects
-        git_objects_dir = self.settings.spec_dir / "objects"
-        is_initialized = git_objects_dir.exists() and git_objects_dir.is_dir()
+        is_initialized = stat.S_ISDIR(objects_stat.st_mode)
 
         debug_logger.log(
             "DEBUG",
@@ -419,7 +406,7 @@ class SpecGitRepository(GitRepository):
         debug_logger.log("INFO", "Adding specific files", files=files)
 
         # Convert to Git work tree context and add
-        converted_paths = [self.path_converter.convert_to_git_path(f) for f in files]
+        converted_paths = self.path_converter.convert_to_git_paths(files)
         git_args = ["add", "-f"] + converted_paths
         self.operations.run_git_command(git_args, capture_output=False)
 
@@ -6,6 +6,19 @@ from typing import Any, Dict, Optional
 
 from ..exceptions import SpecError
 
+# Accepted spellings for boolean environment variables. Defined here, the
+# lowest layer that reads them, and reused by config.settings
+_BOOL_TRUE = frozenset({"1", "true", "yes"})
+_BOOL_FALSE = frozenset({"0", "false", "no"})
+
+# Mapping of spec log level names to stdlib logging levels
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
 
 class DebugLogger:
     """Enhanced debug logging with structured output and timing capabilities."""
@@ -19,7 +32,7 @@ class DebugLogger:
     def _is_debug_enabled(self) -> bool:
         """Check if debug logging is enabled via environment."""
         debug_value = os.environ.get("SPEC_DEBUG", "").lower()
-        return debug_value in ["1", "true", "yes"]
+        return debug_value in _BOOL_TRUE
 
     def _get_debug_level(self) -> str:
         """Get debug level from environment."""
@@ -28,7 +41,7 @@ class DebugLogger:
     def _is_timing_enabled(self) -> bool:
         """Check if performance timing is enabled."""
         timing_value = os.environ.get("SPEC_DEBUG_TIMING", "").lower()
-        return timing_value in ["1", "true", "yes"]
+        return timing_value in _BOOL_TRUE
 
     def _setup_logger(self) -> logging.Logger:
         """Set up the internal logger with appropriate configuration."""
@@ -39,13 +52,7 @@ class DebugLogger:
             return logger
 
         # Set level based on environment
-        level_map = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-        }
-        logger.setLevel(level_map.get(self.level, logging.INFO))
+        logger.setLevel(_LEVEL_MAP.get(self.level, logging.INFO))
 
         # Create console handler if not already present
         if not logger.handlers:
@@ -60,6 +67,21 @@ class DebugLogger:
 
         return logger
 
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether a message at the given level would be emitted.
+
+        Callers can use this to skip building expensive log arguments.
+
+        Args:
+            level: Log level (DEBUG, INFO, WARNING, ERROR)
+
+        Returns:
+            True if messages at this level are emitted
+        """
+        return self.enabled and self.logger.isEnabledFor(
+            _LEVEL_MAP.get(level.upper(), logging.INFO)
+        )
+
     def log(self, level: str, message: str, **kwargs: Any) -> None:
         """Log message with structured data.
 
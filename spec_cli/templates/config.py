@@ -6,6 +6,9 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 from ..exceptions import SpecTemplateError
 from ..logging.debug import debug_logger
 
+# Matches {{variable}} placeholders
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
 
 class TemplateConfig(BaseModel):
     """Configuration for spec template generation with comprehensive validation."""
@@ -148,10 +151,8 @@ class TemplateConfig(BaseModel):
         placeholders = set()
 
         # Find all {{variable}} patterns
-        pattern = re.compile(r"\{\{(\w+)\}\}")
-
         for template_content in [self.index, self.history]:
-            matches = pattern.findall(template_content)
+            matches = _PLACEHOLDER_PATTERN.findall(template_content)
             placeholders.update(matches)
 
         return placeholders
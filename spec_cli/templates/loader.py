@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -11,17 +12,39 @@ from .config import TemplateConfig, TemplateValidator
 from .defaults import get_default_template_config
 
 
+@lru_cache(maxsize=32)
+def _parse_template_yaml(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a template YAML file, memoised on its stat signature.
+
+    The modification time and size are part of the key so an edited file
+    is parsed again; callers must not mutate the returned data.
+
+    Args:
+        path_str: Path to the template file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Parsed YAML data
+    """
+    with open(path_str, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
 class TemplateLoader:
     """Loads template configuration from files with fallback to defaults."""
 
     def __init__(self, settings: Optional[SpecSettings] = None):
         self.settings = settings or get_settings()
         self.validator = TemplateValidator()
-        debug_logger.log(
-            "INFO",
-            "TemplateLoader initialized",
-            template_file=str(self.settings.template_file),
-        )
+        # load_template() builds a loader per call, so skip building the log
+        # arguments when nobody is listening
+        if debug_logger.is_enabled_for("INFO"):
+            debug_logger.log(
+                "INFO",
+                "TemplateLoader initialized",
+                template_file=str(self.settings.template_file),
+            )
 
     def load_template(self) -> TemplateConfig:
         """Load template configuration from .spectemplate file or use defaults.
@@ -54,13 +77,14 @@ class TemplateLoader:
             with debug_logger.timer("validate_template_config"):
                 self.validator.validate_and_raise(config)
 
-            debug_logger.log(
-                "INFO",
-                "Template configuration loaded successfully",
-                template_file=str(template_file),
-                version=config.version,
-                ai_enabled=config.ai_enabled,
-            )
+            if debug_logger.is_enabled_for("INFO"):
+                debug_logger.log(
+                    "INFO",
+                    "Template configuration loaded successfully",
+                    template_file=str(template_file),
+                    version=config.version,
+                    ai_enabled=config.ai_enabled,
+                )
 
             return config
 
@@ -77,8 +101,12 @@ class TemplateLoader:
     def _load_from_file(self, template_file: Path) -> TemplateConfig:
         """Load template configuration from YAML file."""
         try:
-            with template_file.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            # Template loading runs once per generated spec; reuse the parse
+            # while the file is unchanged
+            stat = template_file.stat()
+            data = _parse_template_yaml(
+                str(template_file), stat.st_mtime_ns, stat.st_size
+            )
 
             # Handle empty YAML file
             if data is None:
@@ -94,13 +122,14 @@ class TemplateLoader:
             # Create TemplateConfig with validation
             config = TemplateConfig(**data)
 
-            debug_logger.log(
-                "INFO",
-                "Template data loaded from file",
-                keys=list(data.keys()),
-                has_index=bool(data.get("index")),
-                has_history=bool(data.get("history")),
-            )
+            if debug_logger.is_enabled_for("INFO"):
+                debug_logger.log(
+                    "INFO",
+                    "Template data loaded from file",
+                    keys=list(data.keys()),
+                    has_index=bool(data.get("index")),
+                    has_history=bool(data.get("history")),
+                )
 
             return config
 
@@ -6,6 +6,9 @@ from ..config.settings import SpecSettings, get_settings
 from ..exceptions import SpecTemplateError
 from ..logging.debug import debug_logger
 
+# Valid variable name inside delimiters
+_VARIABLE_NAME_PATTERN = re.compile(r"^\w+$")
+
 
 class TemplateSubstitution:
     """Handles variable substitution in template content with configurable delimiters."""
@@ -20,12 +23,7 @@ class TemplateSubstitution:
         self.open_delimiter = open_delimiter
         self.close_delimiter = close_delimiter
 
-        # Escape delimiters for regex
-        escaped_open = re.escape(open_delimiter)
-        escaped_close = re.escape(close_delimiter)
-
-        # Pattern for finding template variables
-        self.variable_pattern = re.compile(f"{escaped_open}(\\w+){escaped_close}")
+        self._compile_patterns()
 
         # Built-in variable generators
         self.builtin_generators = {
@@ -206,6 +204,28 @@ class TemplateSubstitution:
         """Generate current day."""
         return str(datetime.now().day)
 
+    def _compile_patterns(self) -> None:
+        """Compile the delimiter-dependent regex patterns.
+
+        Called whenever the delimiters are set, so lookups and validation
+        reuse compiled patterns instead of rebuilding them per call.
+        """
+        # Escape delimiters for regex
+        escaped_open = re.escape(self.open_delimiter)
+        escaped_close = re.escape(self.close_delimiter)
+
+        # Pattern for finding template variables
+        self.variable_pattern = re.compile(f"{escaped_open}(\\w+){escaped_close}")
+
+        # Patterns used by validate_template_syntax
+        self._nested_pattern = re.compile(
+            f"{escaped_open}[^{escaped_close}]*{escaped_open}"
+        )
+        self._empty_variable_pattern = re.compile(f"{escaped_open}\\s*{escaped_close}")
+        self._placeholder_pattern = re.compile(
+            f"{escaped_open}([^{escaped_close}]*){escaped_close}"
+        )
+
     def get_variables_in_template(self, template: str) -> Set[str]:
         """Extract all variable names from a template.
 
@@ -238,27 +258,20 @@ class TemplateSubstitution:
             )
 
         # Check for nested delimiters
-        nested_pattern = re.compile(
-            f"{re.escape(self.open_delimiter)}[^{re.escape(self.close_delimiter)}]*{re.escape(self.open_delimiter)}"
-        )
-        if nested_pattern.search(template):
+        if self._nested_pattern.search(template):
             issues.append("Nested delimiters detected")
 
         # Check for empty variables
-        empty_vars = re.findall(
-            f"{re.escape(self.open_delimiter)}\\s*{re.escape(self.close_delimiter)}",
-            template,
-        )
+        empty_vars = self._empty_variable_pattern.findall(template)
         if empty_vars:
             issues.append(f"Found {len(empty_vars)} empty variable placeholders")
 
         # Check for invalid variable names
-        all_matches = re.findall(
-            f"{re.escape(self.open_delimiter)}([^{re.escape(self.close_delimiter)}]*){re.escape(self.close_delimiter)}",
-            template,
-        )
+        all_matches = self._placeholder_pattern.findall(template)
         invalid_vars = [
-            match for match in all_matches if not re.match(r"^\w+$", match.strip())
+            match
+            for match in all_matches
+            if not _VARIABLE_NAME_PATTERN.match(match.strip())
         ]
         if invalid_vars:
             issues.append(f"Invalid variable names: {invalid_vars}")
@@ -333,10 +346,8 @@ class TemplateSubstitution:
         self.open_delimiter = open_delimiter
         self.close_delimiter = close_delimiter
 
-        # Update regex pattern
-        escaped_open = re.escape(open_delimiter)
-        escaped_close = re.escape(close_delimiter)
-        self.variable_pattern = re.compile(f"{escaped_open}(\\w+){escaped_close}")
+        # Update regex patterns
+        self._compile_patterns()
 
         debug_logger.log(
             "INFO",
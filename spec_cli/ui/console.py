@@ -1,3 +1,4 @@
+import re
 from typing import Any, Optional
 
 from rich.console import Console
@@ -6,6 +7,9 @@ from ..config.settings import get_settings
 from ..logging.debug import debug_logger
 from .theme import SpecTheme, get_current_theme
 
+# Extracts the inner text from a "[style]text[/style]" markup string
+_MARKUP_CONTENT_PATTERN = re.compile(r"\[.*?\](.*?)\[/.*?\]")
+
 
 class SpecConsole:
     """Wrapper around Rich Console with spec-specific configuration."""
@@ -107,13 +111,14 @@ class SpecConsole:
         if self.no_color:
             # If no color, just remove emojis
             replacements = self.theme.get_emoji_replacements()
-            for emoji in replacements:
+            for emoji, replacement in replacements.items():
+                # Plain substring check first; most text has no emojis, so
+                # the markup regex only runs for emojis actually present
+                if emoji not in text:
+                    continue
                 # Extract just the character part (remove Rich markup)
-                replacement = replacements[emoji]
                 # Simple regex to extract content between tags
-                import re
-
-                match = re.search(r"\[.*?\](.*?)\[/.*?\]", replacement)
+                match = _MARKUP_CONTENT_PATTERN.search(replacement)
                 if match:
                     text = text.replace(emoji, match.group(1))
                 else:
@@ -12,6 +12,26 @@ from ..logging.debug import debug_logger
 from .console import get_console
 from .styles import SpecStyles
 
+# Resolution suggestions for common OS errors, checked in order
+_OS_ERROR_SUGGESTIONS = (
+    (
+        FileNotFoundError,
+        (
+            "Check if file path is correct",
+            "Verify file exists",
+            "Check directory permissions",
+        ),
+    ),
+    (
+        PermissionError,
+        (
+            "Run with appropriate permissions",
+            "Check file ownership",
+            "Verify directory access rights",
+        ),
+    ),
+)
+
 
 class ErrorPanel:
     """Rich panel for displaying error information with formatting."""
@@ -118,7 +138,8 @@ class ErrorPanel:
             Formatted context string or None
         """
         if isinstance(self.error, FileNotFoundError):
-            return SpecStyles.path(str(getattr(self.error, "filename", "Unknown file")))
+            # OSError always defines filename, but it may be None
+            return SpecStyles.path(str(self.error.filename or "Unknown file"))
         elif isinstance(self.error, PermissionError):
             return SpecStyles.warning("Check file and directory permissions")
         return None
@@ -129,26 +150,12 @@ class ErrorPanel:
         Returns:
             List of suggestion strings
         """
-        suggestions = []
-
-        if isinstance(self.error, FileNotFoundError):
-            suggestions.extend(
-                [
-                    "Check if file path is correct",
-                    "Verify file exists",
-                    "Check directory permissions",
-                ]
-            )
-        elif isinstance(self.error, PermissionError):
-            suggestions.extend(
-                [
-                    "Run with appropriate permissions",
-                    "Check file ownership",
-                    "Verify directory access rights",
-                ]
-            )
+        if isinstance(self.error, OSError):
+            for error_type, suggestions in _OS_ERROR_SUGGESTIONS:
+                if isinstance(self.error, error_type):
+                    return list(suggestions)
 
-        return suggestions
+        return []
 
     def _format_traceback(self) -> Optional[str]:
         """Format traceback for display.
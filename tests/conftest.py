@@ -0,0 +1,30 @@
+"""Shared pytest fixtures for the spec-cli test suite."""
+
+import subprocess
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def block_real_subprocess(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Fail fast if a test would start a real process.
+
+    Tests mock subprocess.run where they exercise Git, so a real process here
+    means a mock leaked. Tests that genuinely need one opt in with
+    ``@pytest.mark.real_subprocess``.
+    """
+    if request.node.get_closest_marker("real_subprocess"):
+        return
+
+    def _blocked(*args: Any, **kwargs: Any) -> Any:
+        command = args[0] if args else kwargs.get("args")
+        raise RuntimeError(
+            f"Real subprocess blocked in tests: {command!r}. Mock it or mark "
+            "the test with @pytest.mark.real_subprocess."
+        )
+
+    monkeypatch.setattr(subprocess, "run", _blocked)
+    monkeypatch.setattr(subprocess, "Popen", _blocked)
@@ -1,5 +1,7 @@
 """Tests for generation validation module."""
 
+import pytest
+
 from spec_cli.cli.commands.generation.validation import (
     GenerationValidator,
     validate_file_paths,
@@ -7,15 +9,19 @@ from spec_cli.cli.commands.generation.validation import (
 )
 
 
+@pytest.fixture(scope="module")
+def validator() -> GenerationValidator:
+    """Create one GenerationValidator; tests must not mutate its state."""
+    return GenerationValidator()
+
+
 class TestGenerationValidator:
     """Test the GenerationValidator class."""
 
     def test_validate_file_paths_when_no_files_provided_then_returns_invalid_with_error(
-        self,
+        self, validator: GenerationValidator
     ) -> None:
         """Test that validation fails when no source files are provided."""
-        validator = GenerationValidator()
-
         result = validator.validate_file_paths([])
 
         assert result["valid"] is False
@@ -24,11 +30,9 @@ class TestGenerationValidator:
         assert result["analysis"] == []
 
     def test_validate_template_selection_when_valid_template_then_returns_valid(
-        self,
+        self, validator: GenerationValidator
     ) -> None:
         """Test that validation succeeds for valid template names."""
-        validator = GenerationValidator()
-
         result = validator.validate_template_selection("default")
 
         assert result["valid"] is True
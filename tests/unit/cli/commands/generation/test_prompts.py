@@ -3,6 +3,8 @@
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from spec_cli.cli.commands.generation.prompts import (
     ConflictResolver,
     GenerationPrompts,
@@ -13,33 +15,44 @@ from spec_cli.cli.commands.generation.prompts import (
 )
 from spec_cli.file_processing.conflict_resolver import ConflictResolutionStrategy
 
+_FEW_FILES = (Path("file1.py"), Path("file2.py"))
+_MANY_FILES = tuple(Path(f"file{i}.py") for i in range(10))
+
+
+@pytest.fixture(scope="module")
+def selector() -> TemplateSelector:
+    """Create one TemplateSelector; tests must not mutate its state."""
+    return TemplateSelector()
+
+
+@pytest.fixture(scope="module")
+def resolver() -> ConflictResolver:
+    """Create one ConflictResolver; tests must not mutate its state."""
+    return ConflictResolver()
+
 
 class TestTemplateSelector:
     """Test the TemplateSelector class."""
 
-    def test_template_selector_initialization_then_creates_console(self) -> None:
+    def test_template_selector_initialization_then_creates_console(
+        self, selector: TemplateSelector
+    ) -> None:
         """Test that TemplateSelector initializes with console."""
-        selector = TemplateSelector()
-
         assert hasattr(selector, "console")
         assert selector.console is not None
 
     def test_get_template_description_when_known_template_then_returns_description(
-        self,
+        self, selector: TemplateSelector
     ) -> None:
         """Test that known templates return proper descriptions."""
-        selector = TemplateSelector()
-
         result = selector._get_template_description("default")
 
         assert result == "Standard documentation template with index and history"
 
     def test_get_template_description_when_unknown_template_then_returns_custom(
-        self,
+        self, selector: TemplateSelector
     ) -> None:
         """Test that unknown templates return custom description."""
-        selector = TemplateSelector()
-
         result = selector._get_template_description("unknown")
 
         assert result == "Custom template"
@@ -48,29 +61,25 @@ class TestTemplateSelector:
 class TestConflictResolver:
     """Test the ConflictResolver class."""
 
-    def test_conflict_resolver_initialization_then_creates_console(self) -> None:
+    def test_conflict_resolver_initialization_then_creates_console(
+        self, resolver: ConflictResolver
+    ) -> None:
         """Test that ConflictResolver initializes with console."""
-        resolver = ConflictResolver()
-
         assert hasattr(resolver, "console")
         assert resolver.console is not None
 
     def test_name_to_strategy_when_valid_name_then_returns_correct_strategy(
-        self,
+        self, resolver: ConflictResolver
     ) -> None:
         """Test that strategy names map to correct enum values."""
-        resolver = ConflictResolver()
-
         result = resolver._name_to_strategy("backup")
 
         assert result == ConflictResolutionStrategy.BACKUP_AND_REPLACE
 
     def test_name_to_strategy_when_invalid_name_then_returns_default_strategy(
-        self,
+        self, resolver: ConflictResolver
     ) -> None:
         """Test that invalid names return default backup strategy."""
-        resolver = ConflictResolver()
-
         result = resolver._name_to_strategy("invalid")
 
         assert result == ConflictResolutionStrategy.BACKUP_AND_REPLACE
@@ -79,18 +88,32 @@ class TestConflictResolver:
 class TestGenerationPrompts:
     """Test the GenerationPrompts class."""
 
-    @patch("spec_cli.cli.commands.generation.prompts.click.confirm")
-    @patch("spec_cli.cli.commands.generation.prompts.get_console")
+    @pytest.fixture
+    def mock_console(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """Patch get_console to hand out one pre-wired console mock."""
+        console = Mock()
+        monkeypatch.setattr(
+            "spec_cli.cli.commands.generation.prompts.get_console", lambda: console
+        )
+        return console
+
+    @pytest.fixture
+    def mock_confirm(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """Patch click.confirm with a stub whose answer tests configure."""
+        confirm = Mock()
+        monkeypatch.setattr(
+            "spec_cli.cli.commands.generation.prompts.click.confirm", confirm
+        )
+        return confirm
+
     def test_confirm_generation_when_few_files_then_shows_all_files(
         self, mock_console: Mock, mock_confirm: Mock
     ) -> None:
         """Test that confirmation with few files shows all files."""
-        mock_console_instance = Mock()
-        mock_console.return_value = mock_console_instance
         mock_confirm.return_value = True
 
         prompts = GenerationPrompts()
-        source_files = [Path("file1.py"), Path("file2.py")]
+        source_files = list(_FEW_FILES)
         template_name = "default"
         conflict_strategy = ConflictResolutionStrategy.BACKUP_AND_REPLACE
 
@@ -100,21 +123,17 @@ class TestGenerationPrompts:
 
         assert result is True
         # Should show summary and all files
-        assert mock_console_instance.print.call_count >= 5
+        assert mock_console.print.call_count >= 5
         mock_confirm.assert_called_once_with("\nProceed with generation?", default=True)
 
-    @patch("spec_cli.cli.commands.generation.prompts.click.confirm")
-    @patch("spec_cli.cli.commands.generation.prompts.get_console")
     def test_confirm_generation_when_many_files_then_shows_truncated_list(
         self, mock_console: Mock, mock_confirm: Mock
     ) -> None:
         """Test that confirmation with many files shows truncated list."""
-        mock_console_instance = Mock()
-        mock_console.return_value = mock_console_instance
         mock_confirm.return_value = False
 
         prompts = GenerationPrompts()
-        source_files = [Path(f"file{i}.py") for i in range(10)]  # 10 files
+        source_files = list(_MANY_FILES)
         template_name = "custom"
         conflict_strategy = ConflictResolutionStrategy.SKIP
 
@@ -124,7 +143,7 @@ class TestGenerationPrompts:
 
         assert result is False
         # Should show summary and truncated file list
-        calls = mock_console_instance.print.call_args_list
+        calls = mock_console.print.call_args_list
         truncated_call = [call for call in calls if "and 7 more" in str(call)]
         assert len(truncated_call) >= 1
 
@@ -1,11 +1,13 @@
 """Tests for generation workflows module."""
 
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 from spec_cli.cli.commands.generation.workflows import (
     AddWorkflow,
     GenerationResult,
     GenerationWorkflow,
+    RegenerationWorkflow,
     create_add_workflow,
     create_generation_workflow,
     create_regeneration_workflow,
@@ -109,6 +111,47 @@ class TestAddWorkflow:
 
         assert result is False
 
+    @patch("spec_cli.cli.commands.generation.workflows.SpecGitRepository")
+    def test_add_files_when_all_spec_files_then_stages_in_one_call(
+        self, mock_repo_class: Mock
+    ) -> None:
+        """Test that spec files are staged with a single Git call."""
+        workflow = AddWorkflow()
+        files = [
+            Path(".specs/a.py/index.md"),
+            Path("src/b.py"),
+            Path(".specs/c.py/index.md"),
+        ]
+
+        result = workflow.add_files(files)
+
+        mock_repo_class.return_value.add_files.assert_called_once_with(
+            [str(files[0]), str(files[2])]
+        )
+        assert result["added"] == [files[0], files[2]]
+        assert result["skipped"][0]["file"] == str(files[1])
+        assert result["success"] is True
+
+    @patch("spec_cli.cli.commands.generation.workflows.SpecGitRepository")
+    def test_add_files_when_batch_fails_then_failure_attributed_per_file(
+        self, mock_repo_class: Mock
+    ) -> None:
+        """Test that a failed batch add falls back to per-file adds."""
+        mock_repo_class.return_value.add_files.side_effect = [
+            Exception("batch failed"),
+            None,
+            Exception("bad file"),
+        ]
+        workflow = AddWorkflow()
+        files = [Path(".specs/a.py/index.md"), Path(".specs/c.py/index.md")]
+
+        result = workflow.add_files(files)
+
+        assert result["added"] == [files[0]]
+        assert result["failed"][0]["file"] == str(files[1])
+        assert result["failed"][0]["error"] == "bad file"
+        assert result["success"] is False
+
 
 class TestFactoryFunctions:
     """Test the workflow factory functions."""
@@ -135,8 +178,6 @@ class TestFactoryFunctions:
         self,
     ) -> None:
         """Test that create_regeneration_workflow returns RegenerationWorkflow instance."""
-        from spec_cli.cli.commands.generation.workflows import RegenerationWorkflow
-
         result = create_regeneration_workflow()
 
         assert isinstance(result, RegenerationWorkflow)
@@ -0,0 +1,45 @@
+"""Shared fixtures for the history command tests."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from spec_cli.cli.commands.history import diff_viewer, formatters
+from spec_cli.ui.console import SpecConsole
+
+
+@pytest.fixture(autouse=True)
+def mock_console(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Route the formatters' and diff viewer's get_console() to one Mock.
+
+    The Mock is specced on SpecConsole so a misspelt console method fails
+    instead of silently returning a new child Mock.
+    """
+    console = Mock(spec=SpecConsole)
+    monkeypatch.setattr(formatters, "get_console", lambda: console)
+    monkeypatch.setattr(diff_viewer, "get_console", lambda: console)
+    return console
+
+
+@pytest.fixture
+def log_formatter(mock_console: Mock) -> formatters.GitLogFormatter:
+    """Create a GitLogFormatter bound to the mocked console."""
+    return formatters.GitLogFormatter()
+
+
+@pytest.fixture
+def diff_formatter(mock_console: Mock) -> formatters.GitDiffFormatter:
+    """Create a GitDiffFormatter bound to the mocked console."""
+    return formatters.GitDiffFormatter()
+
+
+@pytest.fixture
+def commit_formatter(mock_console: Mock) -> formatters.CommitFormatter:
+    """Create a CommitFormatter bound to the mocked console."""
+    return formatters.CommitFormatter()
+
+
+@pytest.fixture
+def diff_view(mock_console: Mock) -> diff_viewer.DiffViewer:
+    """Create a DiffViewer bound to the mocked console."""
+    return diff_viewer.DiffViewer()
@@ -1,9 +1,11 @@
 """Tests for content viewer module."""
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 from unittest.mock import Mock, patch
 
+import pytest
+
 from spec_cli.cli.commands.history.content_viewer import (
     ContentViewer,
     create_content_display,
@@ -12,39 +14,43 @@ from spec_cli.cli.commands.history.content_viewer import (
 )
 
 
+@pytest.fixture(scope="module")
+def viewer() -> ContentViewer:
+    """Create one ContentViewer for the tests of its pure helper methods."""
+    return ContentViewer()
+
+
 class TestContentViewer:
     """Test the ContentViewer class."""
 
     def test_get_syntax_language_when_python_extension_then_returns_python(
-        self,
+        self, viewer: ContentViewer
     ) -> None:
         """Test that Python file extension returns python language."""
-        viewer = ContentViewer()
-
         result = viewer._get_syntax_language(".py")
 
         assert result == "python"
 
-    def test_get_syntax_language_when_unknown_extension_then_returns_text(self) -> None:
+    def test_get_syntax_language_when_unknown_extension_then_returns_text(
+        self, viewer: ContentViewer
+    ) -> None:
         """Test that unknown file extension returns text language."""
-        viewer = ContentViewer()
-
         result = viewer._get_syntax_language(".unknown")
 
         assert result == "text"
 
-    def test_looks_like_markdown_when_contains_header_then_returns_true(self) -> None:
+    def test_looks_like_markdown_when_contains_header_then_returns_true(
+        self, viewer: ContentViewer
+    ) -> None:
         """Test that content with markdown headers is detected as markdown."""
-        viewer = ContentViewer()
-
         result = viewer._looks_like_markdown("# This is a header\nSome content")
 
         assert result is True
 
-    def test_looks_like_markdown_when_plain_text_then_returns_false(self) -> None:
+    def test_looks_like_markdown_when_plain_text_then_returns_false(
+        self, viewer: ContentViewer
+    ) -> None:
         """Test that plain text content is not detected as markdown."""
-        viewer = ContentViewer()
-
         result = viewer._looks_like_markdown(
             "This is just plain text without markdown indicators"
         )
@@ -72,31 +78,33 @@ class TestContentViewer:
 class TestConvenienceFunctions:
     """Test the standalone convenience functions."""
 
-    @patch(
-        "spec_cli.cli.commands.history.content_viewer.ContentViewer.display_spec_content"
-    )
     def test_display_spec_content_function_when_called_then_creates_viewer_and_calls_method(
-        self, mock_display: Any
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test the display_spec_content convenience function."""
+        seen: List[Tuple[Any, ...]] = []
+        monkeypatch.setattr(
+            ContentViewer, "display_spec_content", lambda self, *args: seen.append(args)
+        )
         spec_data = {"content": "test content"}
 
         display_spec_content(spec_data, True)
 
-        mock_display.assert_called_once_with(spec_data, True)
+        assert seen == [(spec_data, True)]
 
-    @patch(
-        "spec_cli.cli.commands.history.content_viewer.ContentViewer.display_file_content"
-    )
     def test_display_file_content_function_when_called_then_creates_viewer_and_calls_method(
-        self, mock_display: Any
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test the display_file_content convenience function."""
+        seen: List[Tuple[Any, ...]] = []
+        monkeypatch.setattr(
+            ContentViewer, "display_file_content", lambda self, *args: seen.append(args)
+        )
         file_path = Path("test.py")
 
         display_file_content(file_path, "content", True, False)
 
-        mock_display.assert_called_once_with(file_path, "content", True, False)
+        assert seen == [(file_path, "content", True, False)]
 
     def test_create_content_display_when_called_then_returns_content_viewer_instance(
         self,
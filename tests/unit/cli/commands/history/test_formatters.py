@@ -3,6 +3,10 @@
 from typing import Any, Dict, List
 from unittest.mock import Mock, patch
 
+import pytest
+from rich.text import Text
+
+from spec_cli.cli.commands.history import formatters
 from spec_cli.cli.commands.history.formatters import (
     CommitFormatter,
     GitDiffFormatter,
@@ -11,225 +15,231 @@ from spec_cli.cli.commands.history.formatters import (
     format_commit_log,
     format_diff_output,
 )
+from spec_cli.ui.console import SpecConsole
+
+# Sample Git data shared by the tests below; the formatters only read it
+_COMMIT_SAMPLE: Dict[str, Any] = {
+    "hash": "abc123def456",
+    "date": "2023-12-01T10:00:00Z",
+    "author": "Test User",
+    "message": "Test commit\nWith details",
+    "files": [
+        {"status": "M", "filename": "test.py"},
+        {"status": "A", "filename": "new.py"},
+    ],
+}
+
+_DIFF_SAMPLE: Dict[str, Any] = {
+    "files": [
+        {
+            "filename": "test.py",
+            "status": "modified",
+            "hunks": [
+                {
+                    "header": "@@ -1,3 +1,4 @@",
+                    "lines": [
+                        " unchanged line",
+                        "-removed line",
+                        "+added line",
+                    ],
+                }
+            ],
+        }
+    ]
+}
 
+_STATS_SAMPLE: Dict[str, Any] = {"files_changed": 2, "insertions": 10, "deletions": 5}
 
-class TestGitLogFormatter:
-    """Test cases for GitLogFormatter."""
-
-    @patch("spec_cli.cli.commands.history.formatters.get_console")
-    def test_format_commit_log_empty(self, mock_get_console: Mock) -> None:
-        """Test formatting empty commit log."""
-        mock_console = Mock()
-        mock_get_console.return_value = mock_console
-
-        formatter = GitLogFormatter()
-        formatter.format_commit_log([])
+_COMMIT_INFO_SAMPLE: Dict[str, Any] = {
+    "hash": "abc123def456",
+    "author": "Test User",
+    "date": "2023-12-01T10:00:00Z",
+    "message": "Test commit\nWith details",
+    "parent": "parent123",
+    "stats": _STATS_SAMPLE,
+}
 
-        mock_console.print.assert_called_once_with("[muted]No commits found[/muted]")
 
-    @patch("spec_cli.cli.commands.history.formatters.SpecTable")
-    @patch("spec_cli.cli.commands.history.formatters.get_console")
-    def test_format_commit_log_compact(
-        self, mock_get_console: Mock, mock_spec_table: Mock
-    ) -> None:
-        """Test formatting commit log in compact mode."""
-        mock_console = Mock()
-        mock_get_console.return_value = mock_console
+@pytest.fixture
+def mock_spec_table(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the SpecTable class used by the formatters with a Mock."""
+    spec_table = Mock()
+    monkeypatch.setattr(formatters, "SpecTable", spec_table)
+    return spec_table
 
-        mock_table = Mock()
-        mock_spec_table.return_value = mock_table
 
-        formatter = GitLogFormatter()
+class TestGitLogFormatter:
+    """Test cases for GitLogFormatter."""
 
-        commits = [
-            {
-                "hash": "abc123",
-                "date": "2023-12-01T10:00:00Z",
-                "author": "Test User",
-                "message": "Test commit",
-            }
-        ]
+    def test_format_commit_log_empty(
+        self, mock_console: Mock, log_formatter: GitLogFormatter
+    ) -> None:
+        """Test formatting empty commit log."""
+        log_formatter.format_commit_log([])
 
-        formatter.format_commit_log(commits, compact=True)
+        mock_console.print.assert_called_once_with(
+            Text.from_markup("[muted]No commits found[/muted]")
+        )
 
-        # Should create a table and print it
-        mock_spec_table.assert_called_once()
-        mock_table.print.assert_called_once()
-
-    @patch("spec_cli.cli.commands.history.formatters.get_console")
-    def test_format_commit_log_detailed(self, mock_get_console: Mock) -> None:
-        """Test formatting commit log in detailed mode."""
-        mock_console = Mock()
-        mock_get_console.return_value = mock_console
-
-        formatter = GitLogFormatter()
-
-        commits = [
-            {
-                "hash": "abc123def456",
-                "date": "2023-12-01T10:00:00Z",
-                "author": "Test User",
-                "message": "Test commit\nWith details",
-                "files": [
-                    {"status": "M", "filename": "test.py"},
-                    {"status": "A", "filename": "new.py"},
-                ],
-            }
-        ]
-
-        formatter.format_commit_log(commits, compact=False)
-
-        # Should print commit details
-        assert mock_console.print.call_count >= 1
-
-    @patch("spec_cli.cli.commands.history.formatters.get_console")
-    def test_format_single_commit(self, mock_get_console: Mock) -> None:
+    @pytest.mark.parametrize("compact", [True, False], ids=["compact", "detailed"])
+    def test_format_commit_log_modes(
+        self,
+        mock_spec_table: Mock,
+        mock_console: Mock,
+        log_formatter: GitLogFormatter,
+        compact: bool,
+    ) -> None:
+        """Test that compact logs render a table and detailed logs print text."""
+        mock_table = mock_spec_table.return_value
+
+        commits = [_COMMIT_SAMPLE]
+
+        log_formatter.format_commit_log(commits, compact=compact)
+
+        if compact:
+            # Should create a table and print it
+            mock_spec_table.assert_called_once()
+            mock_table.print.assert_called_once()
+            mock_console.print.assert_not_called()
+        else:
+            # Should print all commit details in a single call
+            mock_spec_table.assert_not_called()
+            mock_console.print.assert_called_once()
+            output = mock_console.print.call_args.args[0]
+            assert "abc123def456" in output.plain
+            assert "    A new.py" in output.plain
+
+    def test_format_single_commit(
+        self, mock_console: Mock, log_formatter: GitLogFormatter
+    ) -> None:
         """Test formatting a single commit entry."""
-        mock_console = Mock()
-        mock_get_console.return_value = mock_console
+        lines = log_formatter._format_single_commit(_COMMIT_SAMPLE)
 
-        formatter = GitLogFormatter()
+        # Key information is returned as lines instead of being printed
+        mock_console.print.assert_not_called()
 
-        commit = {
-            "hash": "abc123def456",
-            "author": "Test User",
-            "date": "2023-12-01T10:00:00Z",
-            "message": "Test commit",
-            "files": [{"status": "M", "filename": "test.py"}],
-        }
+        # Each value is checked against the individual lines
+        assert lines[0] == Text("commit abc123def456", style="bold yellow")
+        assert any("Test User" in line.plain for line in lines)
+        assert Text("    Test commit") in lines
 
-        formatter._format_single_commit(commit)
+    def test_format_single_commit_keeps_markup_in_message_literal(
+        self, log_formatter: GitLogFormatter
+    ) -> None:
+        """Test that brackets in commit text are not parsed as markup."""
+        commit = {**_COMMIT_SAMPLE, "message": "Fix arr[i] lookup"}
 
-        # Check that key information was printed
-        calls = [
-            str(call.args[0]) for call in mock_console.print.call_args_list if call.args
-        ]
-        commit_info = " ".join(calls)
+        lines = log_formatter._format_single_commit(commit)
 
-        assert "abc123def456" in commit_info
-        assert "Test User" in commit_info
-        assert "Test commit" in commit_info
+        assert Text("    Fix arr[i] lookup") in lines
 
 
 class TestGitDiffFormatter:
     """Test cases for GitDiffFormatter."""
 
-    @patch("spec_cli.cli.commands.history.formatters.get_console")
-    def test_format_diff_output_empty(self, mock_get_console: Mock) -> None:
+    def test_format_diff_output_empty(
+        self, mock_console: Mock, diff_formatter: GitDiffFormatter
+    ) -> None:
         """Test formatting empty diff output."""
-        mock_console = Mock()
-        mock_get_console.return_value = mock_console
-
-        formatter = GitDiffFormatter()
-        formatter.format_diff_output({})
+        diff_formatter.format_diff_output({})
 
         mock_console.print.assert_called_once_with(
-            "[muted]No differences found[/muted]"
+            Text.from_markup("[muted]No differences found[/muted]")
         )
 
-    @patch("spec_cli.cli.commands.history.formatters.get_console")
-    def test_format_diff_output_with_files(self, mock_get_console: Mock) -> None:
+    def test_format_diff_output_with_files(
+        self, mock_console: Mock, diff_formatter: GitDiffFormatter
+    ) -> None:
         """Test formatting diff output with files."""
-        mock_console = Mock()
-        mock_get_console.return_value = mock_console
+        diff_formatter.format_diff_output(_DIFF_SAMPLE)
 
-        formatter = GitDiffFormatter()
+        # Should print summary and file diffs in a single call
+        mock_console.print.assert_called_once()
+        output = mock_console.print.call_args.args[0]
+        assert "Diff Summary: 1 files changed" in output.plain
+        assert "-removed line" in output.plain
 
+    def test_format_diff_output_keeps_emojis_in_diff_text(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that diff text is shown as written, without emoji replacement."""
+        console = SpecConsole(width=120, no_color=True)
+        monkeypatch.setattr(formatters, "get_console", lambda: console)
         diff_data = {
             "files": [
                 {
-                    "filename": "test.py",
+                    "filename": "notes.md",
                     "status": "modified",
-                    "hunks": [
-                        {
-                            "header": "@@ -1,3 +1,4 @@",
-                            "lines": [
-                                " unchanged line",
-                                "-removed line",
-                                "+added line",
-                            ],
-                        }
-                    ],
+                    "hunks": [{"header": "@@ -1 +1 @@", "lines": ["+Done ✅"]}],
                 }
             ]
         }
 
-        formatter.format_diff_output(diff_data)
-
-        # Should print summary and file diffs
-        assert mock_console.print.call_count >= 2
-
-    @patch("spec_cli.cli.commands.history.formatters.get_console")
-    def test_format_diff_line(self, mock_get_console: Mock) -> None:
-        """Test formatting individual diff lines."""
-        mock_console = Mock()
-        mock_get_console.return_value = mock_console
-
-        formatter = GitDiffFormatter()
-
-        # Test different line types
-        formatter._format_diff_line("+added line")
-        formatter._format_diff_line("-removed line")
-        formatter._format_diff_line("@@ header @@")
-        formatter._format_diff_line(" unchanged line")
+        GitDiffFormatter().format_diff_output(diff_data)
+
+        assert "+Done ✅" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        ("line", "expected_style"),
+        [
+            ("+added line", "green"),
+            ("-removed line", "red"),
+            ("@@ header @@", "cyan"),
+            (" unchanged line", "dim"),
+            ("", "dim"),
+        ],
+        ids=["added", "removed", "hunk-header", "context", "empty"],
+    )
+    def test_format_diff_line(
+        self,
+        mock_console: Mock,
+        diff_formatter: GitDiffFormatter,
+        line: str,
+        expected_style: str,
+    ) -> None:
+        """Test that each diff line type is wrapped in its style."""
+        result = diff_formatter._format_diff_line(line)
 
-        assert mock_console.print.call_count == 4
+        assert result == Text(line, style=expected_style)
+        mock_console.print.assert_not_called()
 
 
 class TestCommitFormatter:
     """Test cases for CommitFormatter."""
 
-    @patch("spec_cli.cli.commands.history.formatters.SpecTable")
-    @patch("spec_cli.cli.commands.history.formatters.get_console")
     def test_format_commit_info(
-        self, mock_get_console: Mock, mock_spec_table: Mock
+        self,
+        mock_spec_table: Mock,
+        mock_console: Mock,
+        commit_formatter: CommitFormatter,
     ) -> None:
         """Test formatting commit information."""
-        mock_console = Mock()
-        mock_get_console.return_value = mock_console
-
-        mock_table = Mock()
-        mock_spec_table.return_value = mock_table
+        mock_table = mock_spec_table.return_value
 
-        formatter = CommitFormatter()
-
-        commit_data = {
-            "hash": "abc123def456",
-            "author": "Test User",
-            "date": "2023-12-01T10:00:00Z",
-            "message": "Test commit\nWith details",
-            "parent": "parent123",
-            "stats": {"files_changed": 2, "insertions": 10, "deletions": 5},
-        }
+        commit_formatter.format_commit_info(_COMMIT_INFO_SAMPLE)
 
-        formatter.format_commit_info(commit_data)
+        # Should build both tables and print everything in a single call
+        assert mock_spec_table.call_count == 2
+        mock_table.print.assert_not_called()
+        mock_console.print.assert_called_once()
+        printed = mock_console.print.call_args.args
+        assert printed[0] is mock_table.get_table.return_value
+        assert "  With details" in printed
+        assert printed[-1] is mock_table.get_table.return_value
 
-        # Should create table and print
-        mock_spec_table.assert_called()
-        mock_table.print.assert_called()
-
-    @patch("spec_cli.cli.commands.history.formatters.SpecTable")
-    @patch("spec_cli.cli.commands.history.formatters.get_console")
-    def test_format_commit_stats(
-        self, mock_get_console: Mock, mock_spec_table: Mock
+    def test_build_commit_stats_table(
+        self, mock_spec_table: Mock, commit_formatter: CommitFormatter
     ) -> None:
-        """Test formatting commit statistics."""
-        mock_console = Mock()
-        mock_get_console.return_value = mock_console
-
-        mock_table = Mock()
-        mock_spec_table.return_value = mock_table
-
-        formatter = CommitFormatter()
-
-        stats = {"files_changed": 3, "insertions": 15, "deletions": 8}
+        """Test building the commit statistics table."""
+        mock_table = mock_spec_table.return_value
 
-        formatter._format_commit_stats(stats)
+        result = commit_formatter._build_commit_stats_table(_STATS_SAMPLE)
 
-        # Should create table and call print method
+        # Should fill the table and leave printing to the caller
+        assert result is mock_table
         mock_spec_table.assert_called_once()
-        mock_table.add_row.assert_called()
-        mock_table.print.assert_called_once()
+        mock_table.add_row.assert_any_call("Insertions", "+10")
+        mock_table.print.assert_not_called()
 
 
 class TestConvenienceFunctions:
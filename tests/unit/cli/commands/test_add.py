@@ -1,9 +1,11 @@
 """Tests for add command module."""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, List, Tuple
 from unittest.mock import Mock, patch
 
+import pytest
+
 from spec_cli.cli.commands.add import (
     _analyze_git_status,
     _expand_spec_files,
@@ -11,58 +13,59 @@ from spec_cli.cli.commands.add import (
 )
 
 
-class TestExpandSpecFiles:
-    """Test the _expand_spec_files function."""
+def _make_single_file(root: Path) -> Tuple[Path, List[Path]]:
+    """Create one file and return it as both the input and the expected output."""
+    test_file = root / "test.md"
+    test_file.write_text("content")
+    return test_file, [test_file]
 
-    def test_expand_spec_files_when_single_file_then_returns_file(
-        self, tmp_path: Any
-    ) -> None:
-        """Test that single file is returned as-is."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text("content")
 
-        result = _expand_spec_files([test_file])
+def _make_directory(root: Path) -> Tuple[Path, List[Path]]:
+    """Create a directory with two files and return it with its files."""
+    test_dir = root / "test_dir"
+    test_dir.mkdir()
+    file1 = test_dir / "file1.md"
+    file1.write_text("content1")
+    file2 = test_dir / "file2.md"
+    file2.write_text("content2")
+    return test_dir, [file1, file2]
 
-        assert result == [test_file]
 
-    def test_expand_spec_files_when_directory_then_returns_all_files(
-        self, tmp_path: Any
+class TestExpandSpecFiles:
+    """Test the _expand_spec_files function."""
+
+    @pytest.mark.parametrize(
+        "make_input",
+        [_make_single_file, _make_directory],
+        ids=["single-file", "directory"],
+    )
+    def test_expand_spec_files(
+        self,
+        tmp_path: Path,
+        make_input: Callable[[Path], Tuple[Path, List[Path]]],
     ) -> None:
-        """Test that directory is expanded to all contained files."""
-        test_dir = tmp_path / "test_dir"
-        test_dir.mkdir()
-        file1 = test_dir / "file1.md"
-        file1.write_text("content1")
-        file2 = test_dir / "file2.md"
-        file2.write_text("content2")
+        """Test that files pass through and directories expand to their files."""
+        input_path, expected = make_input(tmp_path)
 
-        result = _expand_spec_files([test_dir])
+        result = _expand_spec_files([input_path])
 
-        assert len(result) == 2
-        assert file1 in result
-        assert file2 in result
+        assert sorted(result) == sorted(expected)
 
 
 class TestFilterSpecFiles:
     """Test the _filter_spec_files function."""
 
-    def test_filter_spec_files_when_file_in_specs_directory_then_included(self) -> None:
-        """Test that files in .specs directory are included."""
-        spec_file = Path(".specs/test.md")
-
-        result = _filter_spec_files([spec_file])
-
-        assert result == [spec_file]
-
-    def test_filter_spec_files_when_file_outside_specs_directory_then_excluded(
-        self,
-    ) -> None:
-        """Test that files outside .specs directory are excluded."""
-        non_spec_file = Path("src/test.py")
-
-        result = _filter_spec_files([non_spec_file])
-
-        assert result == []
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            (Path(".specs/test.md"), [Path(".specs/test.md")]),
+            (Path("src/test.py"), []),
+        ],
+        ids=["inside-specs", "outside-specs"],
+    )
+    def test_filter_spec_files(self, path: Path, expected: List[Path]) -> None:
+        """Test that only files in the .specs directory are kept."""
+        assert _filter_spec_files([path]) == expected
 
 
 class TestAnalyzeGitStatus:
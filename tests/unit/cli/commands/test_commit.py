@@ -1,9 +1,12 @@
 """Tests for commit command (commands/commit.py)."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import pytest
 from click.testing import CliRunner
 
+from spec_cli.cli.commands import commit
 from spec_cli.cli.commands.commit import (
     _auto_stage_changes,
     _show_commit_preview,
@@ -12,6 +15,30 @@ from spec_cli.cli.commands.commit import (
 )
 
 
+@pytest.fixture
+def commit_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the collaborators commit_command calls with Mocks.
+
+    The returned namespace holds the repository returned by
+    get_spec_repository plus the message, confirmation, preview and
+    result helpers, so each test only configures what it checks.
+    """
+    mocks = SimpleNamespace(
+        repo=Mock(),
+        show_message=Mock(),
+        confirm=Mock(),
+        preview=Mock(),
+        result=Mock(),
+    )
+    mocks.get_repo = Mock(return_value=mocks.repo)
+    monkeypatch.setattr(commit, "get_spec_repository", mocks.get_repo)
+    monkeypatch.setattr(commit, "show_message", mocks.show_message)
+    monkeypatch.setattr(commit, "get_user_confirmation", mocks.confirm)
+    monkeypatch.setattr(commit, "_show_commit_preview", mocks.preview)
+    monkeypatch.setattr(commit, "_show_commit_result", mocks.result)
+    return mocks
+
+
 class TestCommitCommand:
     """Test cases for commit command functionality."""
 
@@ -19,186 +46,142 @@ class TestCommitCommand:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("spec_cli.cli.commands.commit.get_user_confirmation")
-    @patch("spec_cli.cli.commands.commit._show_commit_result")
-    @patch("spec_cli.cli.commands.commit._show_commit_preview")
-    @patch("spec_cli.cli.commands.commit.get_spec_repository")
     def test_commit_command_creates_new_commit(
-        self,
-        mock_get_repo: Mock,
-        mock_preview: Mock,
-        mock_result: Mock,
-        mock_confirm: Mock,
+        self, commit_mocks: SimpleNamespace
     ) -> None:
         """Test commit command creates new commit."""
-        # Mock repository
-        mock_repo = Mock()
+        mock_repo = commit_mocks.repo
         mock_repo.get_git_status.return_value = {
             "staged": ["test.py", "doc.md"],
             "modified": [],
             "untracked": [],
         }
         mock_repo.commit.return_value = "abc123def456"
-        mock_get_repo.return_value = mock_repo
-        mock_confirm.return_value = True
+        commit_mocks.confirm.return_value = True
 
         result = self.runner.invoke(commit_command, ["-m", "Test commit"])
 
         assert result.exit_code == 0
         mock_repo.commit.assert_called_once_with("Test commit")
-        mock_preview.assert_called_once()
-        mock_result.assert_called_once()
+        commit_mocks.preview.assert_called_once()
+        commit_mocks.result.assert_called_once()
 
-    @patch("spec_cli.cli.commands.commit._auto_stage_changes")
-    @patch("spec_cli.cli.commands.commit.get_spec_repository")
     def test_commit_command_auto_stages_changes(
-        self, mock_get_repo: Mock, mock_auto_stage: Mock
+        self, commit_mocks: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test commit command auto-stages changes with --all flag."""
-        # Mock repository
-        mock_repo = Mock()
-        mock_repo.get_git_status.side_effect = [
+        mock_auto_stage = Mock()
+        monkeypatch.setattr(commit, "_auto_stage_changes", mock_auto_stage)
+        commit_mocks.repo.get_git_status.side_effect = [
             {"staged": [], "modified": ["test.py"], "untracked": []},
             {"staged": ["test.py"], "modified": [], "untracked": []},
         ]
-        mock_repo.commit.return_value = "abc123def456"
-        mock_get_repo.return_value = mock_repo
+        commit_mocks.repo.commit.return_value = "abc123def456"
+        commit_mocks.confirm.return_value = True
 
-        with patch(
-            "spec_cli.cli.commands.commit.get_user_confirmation", return_value=True
-        ):
-            result = self.runner.invoke(
-                commit_command, ["-a", "-m", "Auto stage commit"]
-            )
+        result = self.runner.invoke(commit_command, ["-a", "-m", "Auto stage commit"])
 
         assert result.exit_code == 0
         mock_auto_stage.assert_called_once()
 
-    @patch("spec_cli.cli.commands.commit._show_commit_result")
-    @patch("spec_cli.cli.commands.commit._show_commit_preview")
-    @patch("spec_cli.cli.commands.commit.get_spec_repository")
     def test_commit_command_amends_last_commit(
-        self, mock_get_repo: Mock, mock_preview: Mock, mock_result: Mock
+        self, commit_mocks: SimpleNamespace
     ) -> None:
         """Test commit command amends last commit."""
-        # Mock repository
-        mock_repo = Mock()
+        mock_repo = commit_mocks.repo
         mock_repo.get_git_status.return_value = {
             "staged": ["test.py"],
             "modified": [],
             "untracked": [],
         }
         mock_repo.amend_commit.return_value = "abc123def456"
-        mock_get_repo.return_value = mock_repo
 
         result = self.runner.invoke(commit_command, ["--amend", "-m", "Amended commit"])
 
         assert result.exit_code == 0
         mock_repo.amend_commit.assert_called_once_with("Amended commit")
-        mock_preview.assert_called_once()
-        mock_result.assert_called_once()
+        commit_mocks.preview.assert_called_once()
+        commit_mocks.result.assert_called_once()
 
-    @patch("spec_cli.cli.commands.commit._show_commit_preview")
-    @patch("spec_cli.cli.commands.commit.show_message")
-    @patch("spec_cli.cli.commands.commit.get_spec_repository")
     def test_commit_command_dry_run_preview(
-        self, mock_get_repo: Mock, mock_show_message: Mock, mock_preview: Mock
+        self, commit_mocks: SimpleNamespace
     ) -> None:
         """Test commit command dry run shows preview without committing."""
-        # Mock repository
-        mock_repo = Mock()
+        mock_repo = commit_mocks.repo
         mock_repo.get_git_status.return_value = {
             "staged": ["test.py"],
             "modified": [],
             "untracked": [],
         }
-        mock_get_repo.return_value = mock_repo
 
         result = self.runner.invoke(
             commit_command, ["--dry-run", "-m", "Dry run commit"]
         )
 
         assert result.exit_code == 0
-        mock_preview.assert_called_once()
-        mock_show_message.assert_called_with(
+        commit_mocks.preview.assert_called_once()
+        commit_mocks.show_message.assert_called_with(
             "This is a dry run. No commit would be created.", "info"
         )
         # Should not call commit
         mock_repo.commit.assert_not_called()
         mock_repo.amend_commit.assert_not_called()
 
-    @patch("spec_cli.cli.commands.commit.show_message")
-    @patch("spec_cli.cli.commands.commit.get_spec_repository")
     def test_commit_command_no_staged_changes(
-        self, mock_get_repo: Mock, mock_show_message: Mock
+        self, commit_mocks: SimpleNamespace
     ) -> None:
         """Test commit command when no changes are staged."""
-        # Mock repository
-        mock_repo = Mock()
-        mock_repo.get_git_status.return_value = {
+        commit_mocks.repo.get_git_status.return_value = {
             "staged": [],
             "modified": ["test.py"],
             "untracked": [],
         }
-        mock_get_repo.return_value = mock_repo
 
         result = self.runner.invoke(commit_command, ["-m", "Test commit"])
 
         assert result.exit_code == 0
-        mock_show_message.assert_called_with(
+        commit_mocks.show_message.assert_called_with(
             "No changes staged for commit. Use 'spec add' to stage changes "
             "or use --all to stage all modified files.",
             "warning",
         )
 
-    @patch("spec_cli.cli.commands.commit.show_message")
-    @patch("spec_cli.cli.commands.commit.get_spec_repository")
     def test_commit_command_no_changes_clean_directory(
-        self, mock_get_repo: Mock, mock_show_message: Mock
+        self, commit_mocks: SimpleNamespace
     ) -> None:
         """Test commit command when working directory is clean."""
-        # Mock repository
-        mock_repo = Mock()
-        mock_repo.get_git_status.return_value = {
+        commit_mocks.repo.get_git_status.return_value = {
             "staged": [],
             "modified": [],
             "untracked": [],
         }
-        mock_get_repo.return_value = mock_repo
 
         result = self.runner.invoke(commit_command, ["-m", "Test commit"])
 
         assert result.exit_code == 0
-        mock_show_message.assert_called_with(
+        commit_mocks.show_message.assert_called_with(
             "No changes to commit. Working directory clean.", "info"
         )
 
-    @patch("spec_cli.cli.commands.commit.get_user_confirmation")
-    @patch("spec_cli.cli.commands.commit.show_message")
-    @patch("spec_cli.cli.commands.commit.get_spec_repository")
-    def test_commit_command_user_cancels(
-        self, mock_get_repo: Mock, mock_show_message: Mock, mock_confirm: Mock
-    ) -> None:
+    def test_commit_command_user_cancels(self, commit_mocks: SimpleNamespace) -> None:
         """Test commit command when user cancels confirmation."""
-        # Mock repository
-        mock_repo = Mock()
-        mock_repo.get_git_status.return_value = {
+        commit_mocks.repo.get_git_status.return_value = {
             "staged": ["test.py"],
             "modified": [],
             "untracked": [],
         }
-        mock_get_repo.return_value = mock_repo
-        mock_confirm.return_value = False
+        commit_mocks.confirm.return_value = False
 
         result = self.runner.invoke(commit_command, ["-m", "Test commit"])
 
         assert result.exit_code == 0
-        mock_show_message.assert_called_with("Commit cancelled", "info")
+        commit_mocks.show_message.assert_called_with("Commit cancelled", "info")
 
-    @patch("spec_cli.cli.commands.commit.get_spec_repository")
-    def test_commit_command_repository_error(self, mock_get_repo: Mock) -> None:
+    def test_commit_command_repository_error(
+        self, commit_mocks: SimpleNamespace
+    ) -> None:
         """Test commit command handles repository errors."""
-        mock_get_repo.side_effect = Exception("Repository error")
+        commit_mocks.get_repo.side_effect = Exception("Repository error")
 
         result = self.runner.invoke(commit_command, ["-m", "Test commit"])
 
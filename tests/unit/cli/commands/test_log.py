@@ -2,22 +2,25 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
 from click.testing import CliRunner
 
 from spec_cli.cli.commands.log import log_command
 
 
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Create one CliRunner shared by the log command tests."""
+    return CliRunner()
+
+
 class TestLogCommand:
     """Test cases for log command functionality."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
     @patch("spec_cli.cli.commands.log.get_spec_repository")
     @patch("spec_cli.cli.commands.log.format_commit_log")
     def test_log_command_shows_commit_history(
-        self, mock_format_log: Mock, mock_get_repo: Mock
+        self, mock_format_log: Mock, mock_get_repo: Mock, runner: CliRunner
     ) -> None:
         """Test log command shows commit history."""
         # Mock repository
@@ -32,7 +35,7 @@ class TestLogCommand:
         ]
         mock_get_repo.return_value = mock_repo
 
-        result = self.runner.invoke(log_command, [])
+        result = runner.invoke(log_command, [])
 
         assert result.exit_code == 0
         mock_repo.get_commit_history.assert_called_once()
@@ -41,7 +44,7 @@ class TestLogCommand:
     @patch("spec_cli.cli.commands.log.get_spec_repository")
     @patch("spec_cli.cli.commands.log.format_commit_log")
     def test_log_command_filters_by_date_and_author(
-        self, mock_format_log: Mock, mock_get_repo: Mock
+        self, mock_format_log: Mock, mock_get_repo: Mock, runner: CliRunner
     ) -> None:
         """Test log command filters by date and author."""
         # Mock repository
@@ -56,7 +59,7 @@ class TestLogCommand:
         ]
         mock_get_repo.return_value = mock_repo
 
-        result = self.runner.invoke(
+        result = runner.invoke(
             log_command,
             ["--since", "2023-01-01", "--until", "2023-12-31", "--author", "John Doe"],
         )
@@ -74,7 +77,7 @@ class TestLogCommand:
     @patch("spec_cli.cli.commands.log.get_spec_repository")
     @patch("spec_cli.cli.commands.log.format_commit_log")
     def test_log_command_shows_file_specific_history(
-        self, mock_format_log: Mock, mock_get_repo: Mock
+        self, mock_format_log: Mock, mock_get_repo: Mock, runner: CliRunner
     ) -> None:
         """Test log command shows file-specific history."""
         # Mock repository
@@ -89,7 +92,7 @@ class TestLogCommand:
         ]
         mock_get_repo.return_value = mock_repo
 
-        result = self.runner.invoke(log_command, ["src/main.py"])
+        result = runner.invoke(log_command, ["src/main.py"])
 
         assert result.exit_code == 0
         mock_repo.get_commit_history.assert_called_once()
@@ -100,7 +103,7 @@ class TestLogCommand:
     @patch("spec_cli.cli.commands.log.get_spec_repository")
     @patch("spec_cli.cli.commands.log.format_commit_log")
     def test_log_command_oneline_format(
-        self, mock_format_log: Mock, mock_get_repo: Mock
+        self, mock_format_log: Mock, mock_get_repo: Mock, runner: CliRunner
     ) -> None:
         """Test log command with oneline format."""
         # Mock repository
@@ -115,7 +118,7 @@ class TestLogCommand:
         ]
         mock_get_repo.return_value = mock_repo
 
-        result = self.runner.invoke(log_command, ["--oneline"])
+        result = runner.invoke(log_command, ["--oneline"])
 
         assert result.exit_code == 0
         mock_format_log.assert_called_once_with(
@@ -125,7 +128,7 @@ class TestLogCommand:
     @patch("spec_cli.cli.commands.log.get_spec_repository")
     @patch("spec_cli.cli.commands.log.show_message")
     def test_log_command_no_commits_found(
-        self, mock_show_message: Mock, mock_get_repo: Mock
+        self, mock_show_message: Mock, mock_get_repo: Mock, runner: CliRunner
     ) -> None:
         """Test log command when no commits found."""
         # Mock repository
@@ -133,7 +136,7 @@ class TestLogCommand:
         mock_repo.get_commit_history.return_value = []
         mock_get_repo.return_value = mock_repo
 
-        result = self.runner.invoke(log_command, [])
+        result = runner.invoke(log_command, [])
 
         assert result.exit_code == 0
         mock_show_message.assert_called_with("No commits found in repository", "info")
@@ -141,7 +144,7 @@ class TestLogCommand:
     @patch("spec_cli.cli.commands.log.get_spec_repository")
     @patch("spec_cli.cli.commands.log.show_message")
     def test_log_command_no_commits_for_files(
-        self, mock_show_message: Mock, mock_get_repo: Mock
+        self, mock_show_message: Mock, mock_get_repo: Mock, runner: CliRunner
     ) -> None:
         """Test log command when no commits found for specific files."""
         # Mock repository
@@ -149,7 +152,7 @@ class TestLogCommand:
         mock_repo.get_commit_history.return_value = []
         mock_get_repo.return_value = mock_repo
 
-        result = self.runner.invoke(log_command, ["src/main.py"])
+        result = runner.invoke(log_command, ["src/main.py"])
 
         assert result.exit_code == 0
         mock_show_message.assert_called_with(
@@ -159,7 +162,7 @@ class TestLogCommand:
     @patch("spec_cli.cli.commands.log.get_spec_repository")
     @patch("spec_cli.cli.commands.log.format_commit_log")
     def test_log_command_with_limit(
-        self, mock_format_log: Mock, mock_get_repo: Mock
+        self, mock_format_log: Mock, mock_get_repo: Mock, runner: CliRunner
     ) -> None:
         """Test log command with custom limit."""
         # Mock repository
@@ -167,7 +170,7 @@ class TestLogCommand:
         mock_repo.get_commit_history.return_value = []
         mock_get_repo.return_value = mock_repo
 
-        result = self.runner.invoke(log_command, ["--limit", "20"])
+        result = runner.invoke(log_command, ["--limit", "20"])
 
         assert result.exit_code == 0
         mock_repo.get_commit_history.assert_called_once()
@@ -177,7 +180,7 @@ class TestLogCommand:
     @patch("spec_cli.cli.commands.log.get_spec_repository")
     @patch("spec_cli.cli.commands.log.format_commit_log")
     def test_log_command_with_grep_filter(
-        self, mock_format_log: Mock, mock_get_repo: Mock
+        self, mock_format_log: Mock, mock_get_repo: Mock, runner: CliRunner
     ) -> None:
         """Test log command with grep filter."""
         # Mock repository
@@ -187,7 +190,7 @@ class TestLogCommand:
         ]
         mock_get_repo.return_value = mock_repo
 
-        result = self.runner.invoke(log_command, ["--grep", "feat"])
+        result = runner.invoke(log_command, ["--grep", "feat"])
 
         assert result.exit_code == 0
         mock_repo.get_commit_history.assert_called_once()
@@ -197,7 +200,7 @@ class TestLogCommand:
     @patch("spec_cli.cli.commands.log.get_spec_repository")
     @patch("spec_cli.cli.commands.log.format_commit_log")
     def test_log_command_with_stats(
-        self, mock_format_log: Mock, mock_get_repo: Mock
+        self, mock_format_log: Mock, mock_get_repo: Mock, runner: CliRunner
     ) -> None:
         """Test log command with file change statistics."""
         # Mock repository
@@ -212,7 +215,7 @@ class TestLogCommand:
         ]
         mock_get_repo.return_value = mock_repo
 
-        result = self.runner.invoke(log_command, ["--stat"])
+        result = runner.invoke(log_command, ["--stat"])
 
         assert result.exit_code == 0
         mock_repo.get_commit_history.assert_called_once()
@@ -222,7 +225,7 @@ class TestLogCommand:
     @patch("spec_cli.cli.commands.log.get_spec_repository")
     @patch("spec_cli.cli.commands.log.show_message")
     def test_log_command_shows_filter_context(
-        self, mock_show_message: Mock, mock_get_repo: Mock
+        self, mock_show_message: Mock, mock_get_repo: Mock, runner: CliRunner
     ) -> None:
         """Test log command shows filter context in output."""
         # Mock repository
@@ -232,7 +235,7 @@ class TestLogCommand:
         ]
         mock_get_repo.return_value = mock_repo
 
-        result = self.runner.invoke(
+        result = runner.invoke(
             log_command,
             [
                 "src/main.py",
@@ -255,18 +258,20 @@ class TestLogCommand:
         assert "containing 'feature'" in context_message
 
     @patch("spec_cli.cli.commands.log.get_spec_repository")
-    def test_log_command_repository_error(self, mock_get_repo: Mock) -> None:
+    def test_log_command_repository_error(
+        self, mock_get_repo: Mock, runner: CliRunner
+    ) -> None:
         """Test log command handles repository errors."""
         mock_get_repo.side_effect = Exception("Repository error")
 
-        result = self.runner.invoke(log_command, [])
+        result = runner.invoke(log_command, [])
 
         assert result.exit_code == 1
         assert "Log failed" in result.output
 
-    def test_log_command_help(self) -> None:
+    def test_log_command_help(self, runner: CliRunner) -> None:
         """Test log command help display."""
-        result = self.runner.invoke(log_command, ["--help"])
+        result = runner.invoke(log_command, ["--help"])
 
         assert result.exit_code == 0
         assert "Show commit history" in result.output
@@ -281,7 +286,7 @@ class TestLogCommand:
     @patch("spec_cli.cli.commands.log.get_spec_repository")
     @patch("spec_cli.cli.commands.log.format_commit_log")
     def test_log_command_multiple_files(
-        self, mock_format_log: Mock, mock_get_repo: Mock
+        self, mock_format_log: Mock, mock_get_repo: Mock, runner: CliRunner
     ) -> None:
         """Test log command with multiple files."""
         # Mock repository
@@ -291,7 +296,7 @@ class TestLogCommand:
         ]
         mock_get_repo.return_value = mock_repo
 
-        result = self.runner.invoke(log_command, ["file1.py", "file2.py"])
+        result = runner.invoke(log_command, ["file1.py", "file2.py"])
 
         assert result.exit_code == 0
         mock_repo.get_commit_history.assert_called_once()
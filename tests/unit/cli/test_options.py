@@ -140,6 +140,19 @@ class TestSpecCommandDecorator:
         # Should handle the error gracefully (exit code != 0)
         assert result.exit_code != 0
 
+    def test_spec_command_when_error_handling_disabled_then_exception_propagates(
+        self,
+    ) -> None:
+        """Test that handle_errors=False leaves exceptions to the caller."""
+
+        @spec_command(handle_errors=False)
+        def test_cmd(debug: bool, verbose: bool) -> None:
+            raise ValueError("test error")
+
+        runner = CliRunner()
+        result = runner.invoke(cast(click.BaseCommand, test_cmd), [])
+        assert isinstance(result.exception, ValueError)
+
 
 class TestValidationHelpers:
     """Test cases for option validation helpers."""
@@ -229,3 +229,18 @@ class TestProgressContextDecorator:
         # Verify progress manager still called finish operation
         mock_manager.start_indeterminate_operation.assert_called_once()
         mock_manager.finish_operation.assert_called_once()
+
+    @patch("spec_cli.ui.progress_manager.get_progress_manager")
+    def test_with_progress_context_decorator_when_applied_then_preserves_metadata(
+        self, mock_get_progress_manager: Mock
+    ) -> None:
+        """Test that with_progress_context keeps the wrapped function's metadata."""
+
+        def documented_function() -> None:
+            """Original docstring."""
+
+        decorated = with_progress_context("meta_operation")(documented_function)
+
+        assert decorated.__name__ == "documented_function"
+        assert decorated.__doc__ == "Original docstring."
+        assert decorated.__wrapped__ is documented_function  # type: ignore[attr-defined]
@@ -11,6 +11,7 @@ from spec_cli.config.settings import (
     SpecSettings,
     get_console,
     get_settings,
+    refresh_env_cache,
 )
 from spec_cli.exceptions import SpecConfigurationError
 
@@ -61,6 +62,17 @@ class TestSpecSettings:
             assert settings.use_color is False
             assert settings.console_width == 120
 
+    def test_spec_settings_reads_environment_lazily_then_caches(self) -> None:
+        """Test that env-derived settings are resolved on first access only."""
+        with patch.dict(os.environ, {"SPEC_DEBUG": "0"}, clear=True):
+            settings = SpecSettings()
+
+            os.environ["SPEC_DEBUG"] = "1"
+            assert settings.debug_enabled is True
+
+            os.environ["SPEC_DEBUG"] = "0"
+            assert settings.debug_enabled is True
+
     def test_spec_settings_validates_initialization_state(self) -> None:
         """Test that SpecSettings correctly detects initialization state."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -133,12 +145,50 @@ class TestSpecSettings:
         with patch.dict(os.environ, {"TEST_VAR": "false"}, clear=True):
             assert settings._get_bool_env("TEST_VAR", True) is False
 
+        # Mixed case outside the fast lookup table
+        with patch.dict(os.environ, {"TEST_VAR": "tRuE"}, clear=True):
+            assert settings._get_bool_env("TEST_VAR", False) is True
+
+        with patch.dict(os.environ, {"TEST_VAR": "nO"}, clear=True):
+            assert settings._get_bool_env("TEST_VAR", True) is False
+
         # Test default value
         with patch.dict(os.environ, {}, clear=True):
             assert settings._get_bool_env("NONEXISTENT", True) is True
             assert settings._get_bool_env("NONEXISTENT", False) is False
 
 
+class TestEnvironmentCache:
+    """Test the optional environment snapshot used by SpecSettings."""
+
+    def teardown_method(self) -> None:
+        """Drop any snapshot taken during the test."""
+        refresh_env_cache()
+
+    def test_env_cache_when_enabled_then_ignores_later_changes(self) -> None:
+        """Test that SPEC_CACHE_ENV snapshots the environment on first use."""
+        refresh_env_cache()
+        with patch.dict(
+            os.environ, {"SPEC_CACHE_ENV": "1", "SPEC_USE_COLOR": "false"}, clear=True
+        ):
+            assert SpecSettings().use_color is False
+
+            os.environ["SPEC_USE_COLOR"] = "true"
+            assert SpecSettings().use_color is False
+
+            refresh_env_cache()
+            assert SpecSettings().use_color is True
+
+    def test_env_cache_when_disabled_then_reads_live_environment(self) -> None:
+        """Test that the live environment is used without SPEC_CACHE_ENV."""
+        refresh_env_cache()
+        with patch.dict(os.environ, {"SPEC_USE_COLOR": "false"}, clear=True):
+            assert SpecSettings().use_color is False
+
+            os.environ["SPEC_USE_COLOR"] = "true"
+            assert SpecSettings().use_color is True
+
+
 class TestSettingsManager:
     """Test the SettingsManager class functionality."""
 
@@ -183,6 +233,15 @@ class TestSettingsManager:
                 # Should be different console instances
                 assert console1 is not console2
 
+    def test_settings_manager_console_fast_path_skips_settings_lookup(self) -> None:
+        """Test that an existing console is returned without re-checking settings."""
+        console1 = SettingsManager.get_console()
+
+        with patch.object(SettingsManager, "get_settings") as mock_get_settings:
+            assert SettingsManager.get_console() is console1
+
+        mock_get_settings.assert_not_called()
+
     def test_settings_manager_reset_functionality(self) -> None:
         """Test that SettingsManager.reset() clears instances."""
         settings1 = SettingsManager.get_settings()
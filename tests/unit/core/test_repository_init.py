@@ -12,13 +12,20 @@ from spec_cli.file_system.directory_manager import DirectoryManager
 from spec_cli.git.repository import SpecGitRepository
 
 
+@pytest.fixture(scope="module")
+def settings_template() -> Mock:
+    """Build the SpecSettings-specced Mock once for the whole module."""
+    return Mock(spec=SpecSettings)
+
+
 class TestSpecRepositoryInitializer:
     """Tests for SpecRepositoryInitializer class."""
 
     @pytest.fixture
-    def mock_settings(self, tmp_path: Path) -> Mock:
-        """Create mock settings for testing."""
-        settings = Mock(spec=SpecSettings)
+    def mock_settings(self, settings_template: Mock, tmp_path: Path) -> Mock:
+        """Reset the shared settings mock and point it at this test's tmp_path."""
+        settings = settings_template
+        settings.reset_mock()
         settings.spec_dir = tmp_path / ".spec"
         settings.specs_dir = tmp_path / ".specs"
         settings.index_file = tmp_path / ".spec-index"
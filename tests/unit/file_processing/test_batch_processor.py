@@ -339,11 +339,18 @@ class TestBatchFileProcessor:
         assert result.total_files == 3
         assert len(result.warnings) > 0  # Should warn about limiting files
 
-        # Test force_regenerate
+    def test_batch_processing_force_regenerate_skips_change_detection(
+        self, mock_processor: BatchFileProcessor
+    ) -> None:
+        """Test that force_regenerate processes files without change detection."""
+        file_paths = [Path(f"file{i}.py") for i in range(10)]
+        mock_processor.pipeline.process_file.return_value = FileProcessingResult(
+            file_path=file_paths[0], success=True
+        )
+
         options = BatchProcessingOptions(force_regenerate=True)
-        mock_processor.change_detector.reset_mock()
+        mock_processor.process_files(file_paths, options)
 
-        result = mock_processor.process_files(file_paths, options)
         # Should not call get_files_needing_processing when force_regenerate=True
         mock_processor.change_detector.get_files_needing_processing.assert_not_called()
 
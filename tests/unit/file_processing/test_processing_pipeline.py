@@ -200,9 +200,15 @@ class TestFileProcessingPipeline:
         # Should not call content generator
         mock_dependencies["content_generator"].generate_spec_content.assert_not_called()
 
-        # Test force regenerate
-        change_detector.reset_mock()
-        result = pipeline.process_file(file_path, force_regenerate=True)
+    def test_pipeline_force_regenerate_skips_change_detection(
+        self, pipeline: FileProcessingPipeline, mock_dependencies: Dict[str, MagicMock]
+    ) -> None:
+        """Test that force regenerate bypasses change detection."""
+        file_path = Path("/test/unchanged_file.py")
+        change_detector = mock_dependencies["change_detector"]
+        change_detector.has_file_changed.return_value = False
+
+        pipeline.process_file(file_path, force_regenerate=True)
 
         # Should not check for changes when force regenerate
         change_detector.has_file_changed.assert_not_called()
@@ -71,6 +71,25 @@ class TestDirectoryManager:
         # Directory should be writable
         assert spec_dir.stat().st_mode & 0o200  # Write permission
 
+    def test_directory_manager_ensure_specs_directory_is_idempotent(
+        self, manager: DirectoryManager, mock_settings: Mock
+    ) -> None:
+        """Test that ensuring an existing .specs directory succeeds."""
+        manager.ensure_specs_directory()
+        manager.ensure_specs_directory()
+
+        assert mock_settings.specs_dir.is_dir()
+
+    def test_directory_manager_create_spec_directory_over_file_raises(
+        self, manager: DirectoryManager, mock_settings: Mock
+    ) -> None:
+        """Test that a file in place of the spec directory is reported."""
+        manager.ensure_specs_directory()
+        (mock_settings.specs_dir / "notes").write_text("not a directory")
+
+        with pytest.raises(SpecFileError):
+            manager.create_spec_directory(Path("notes.py"))
+
     def test_directory_manager_checks_existing_specs(
         self, manager: DirectoryManager, mock_settings: Mock, temp_dir: Path
     ) -> None:
@@ -1,7 +1,5 @@
-import tempfile
 import time
 from pathlib import Path
-from typing import Generator
 from unittest.mock import Mock, patch
 
 import pytest
@@ -10,41 +8,33 @@ from spec_cli.exceptions import SpecFileError
 from spec_cli.file_system import file_utils
 
 
-class TestFileUtils:
-    """Test suite for file utility functions."""
-
-    @pytest.fixture
-    def temp_file(self) -> Generator[Path, None, None]:
-        """Create a temporary file for testing."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-            f.write("print('Hello, World!')")
-            temp_path = Path(f.name)
+@pytest.fixture(scope="module")
+def temp_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one read-only temporary file shared by the tests in this module."""
+    temp_path = tmp_path_factory.mktemp("file_utils") / "sample.py"
+    temp_path.write_text("print('Hello, World!')")
+    return temp_path
 
-        yield temp_path
 
-        # Cleanup
-        if temp_path.exists():
-            temp_path.unlink()
+class TestFileUtils:
+    """Test suite for file utility functions."""
 
     @pytest.fixture
-    def temp_dir_with_files(self) -> Generator[Path, None, None]:
+    def temp_dir_with_files(self, tmp_path: Path) -> Path:
         """Create a temporary directory with various files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Create files of different sizes and types
+        (tmp_path / "small.py").write_text("print('small')")
+        (tmp_path / "medium.js").write_text("console.log('medium file');\n" * 10)
+        (tmp_path / "large.txt").write_text("Large content\n" * 100)
+        (tmp_path / "config.json").write_text('{"key": "value"}')
+        (tmp_path / "README.md").write_text("# Test")
 
-            # Create files of different sizes and types
-            (temp_path / "small.py").write_text("print('small')")
-            (temp_path / "medium.js").write_text("console.log('medium file');\n" * 10)
-            (temp_path / "large.txt").write_text("Large content\n" * 100)
-            (temp_path / "config.json").write_text('{"key": "value"}')
-            (temp_path / "README.md").write_text("# Test")
+        # Create a subdirectory with files
+        subdir = tmp_path / "subdir"
+        subdir.mkdir()
+        (subdir / "nested.py").write_text("print('nested')")
 
-            # Create a subdirectory with files
-            subdir = temp_path / "subdir"
-            subdir.mkdir()
-            (subdir / "nested.py").write_text("print('nested')")
-
-            yield temp_path
+        return tmp_path
 
     def test_ensure_file_readable_validates_accessibility(
         self, temp_file: Path
@@ -58,9 +48,16 @@ class TestFileUtils:
         assert file_utils.ensure_file_readable(non_existent) is False
 
         # Test directory (not a regular file)
-        with tempfile.TemporaryDirectory() as temp_dir:
-            dir_path = Path(temp_dir)
-            assert file_utils.ensure_file_readable(dir_path) is False
+        assert file_utils.ensure_file_readable(temp_file.parent) is False
+
+    def test_ensure_file_readable_returns_false_for_symlink_loop(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that an unresolvable path is reported as unreadable, not raised."""
+        loop = tmp_path / "loop"
+        loop.symlink_to(loop)
+
+        assert file_utils.ensure_file_readable(loop) is False
 
     def test_file_extension_stats_counts_correctly(
         self, temp_dir_with_files: Path
@@ -110,6 +107,17 @@ class TestFileUtils:
                 assert isinstance(size_next, (int, float))
                 assert size_current >= size_next
 
+    def test_largest_files_finder_returns_top_n_only(
+        self, temp_dir_with_files: Path
+    ) -> None:
+        """Test that only the largest N files are returned, in size order."""
+        largest_files = file_utils.find_largest_files(temp_dir_with_files, limit=2)
+
+        assert [info["path"].name for info in largest_files] == [  # type: ignore[union-attr]
+            "large.txt",
+            "medium.js",
+        ]
+
     def test_recently_modified_finder_sorts_by_time(
         self, temp_dir_with_files: Path
     ) -> None:
@@ -1,4 +1,4 @@
-import tempfile
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -38,262 +38,307 @@ class TestPathResolver:
 
         assert resolver.settings is custom_settings
 
-    def test_resolve_input_path_handles_current_directory(self) -> None:
+    def test_resolve_input_path_handles_current_directory(self, tmp_path: Path) -> None:
         """Test resolving current directory '.' input."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            with patch("pathlib.Path.cwd", return_value=root_path):
-                result = resolver.resolve_input_path(".")
+        with patch("pathlib.Path.cwd", return_value=root_path):
+            result = resolver.resolve_input_path(".")
 
-                # Should return empty path for current directory
-                assert result == Path(".")
+            # Should return empty path for current directory
+            assert result == Path(".")
 
-    def test_resolve_input_path_handles_relative_paths(self) -> None:
+    def test_resolve_input_path_handles_relative_paths(self, tmp_path: Path) -> None:
         """Test resolving relative paths."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            # Create subdirectory
-            subdir = root_path / "subdir"
-            subdir.mkdir()
+        # Create subdirectory
+        subdir = root_path / "subdir"
+        subdir.mkdir()
 
-            with patch("pathlib.Path.cwd", return_value=root_path):
-                result = resolver.resolve_input_path("subdir")
+        with patch("pathlib.Path.cwd", return_value=root_path):
+            result = resolver.resolve_input_path("subdir")
 
-                assert result == Path("subdir")
+            assert result == Path("subdir")
 
-    def test_resolve_input_path_handles_absolute_paths_within_project(self) -> None:
+    def test_resolve_input_path_handles_absolute_paths_within_project(
+        self, tmp_path: Path
+    ) -> None:
         """Test resolving absolute paths within project boundaries."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            # Create file within project
-            test_file = root_path / "test.py"
-            test_file.touch()
+        # Create file within project
+        test_file = root_path / "test.py"
+        test_file.touch()
 
-            result = resolver.resolve_input_path(str(test_file))
+        result = resolver.resolve_input_path(str(test_file))
 
-            assert result == Path("test.py")
+        assert result == Path("test.py")
 
-    def test_resolve_input_path_rejects_paths_outside_project(self) -> None:
+    def test_resolve_input_path_rejects_paths_outside_project(
+        self, tmp_path: Path
+    ) -> None:
         """Test that paths outside project boundaries are rejected."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir) / "project"
-            root_path.mkdir()
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path / "project"
+        root_path.mkdir()
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            # Path outside project
-            outside_path = Path(temp_dir) / "outside.py"
-            outside_path.touch()
+        # Path outside project
+        outside_path = tmp_path / "outside.py"
+        outside_path.touch()
 
-            with pytest.raises(SpecValidationError) as exc_info:
-                resolver.resolve_input_path(str(outside_path))
+        with pytest.raises(SpecValidationError) as exc_info:
+            resolver.resolve_input_path(str(outside_path))
 
-            assert "outside project root" in str(exc_info.value)
+        assert "outside project root" in str(exc_info.value)
 
-    def test_resolve_input_path_handles_os_errors(self) -> None:
+    def test_resolve_input_path_handles_os_errors(self, tmp_path: Path) -> None:
         """Test error handling for OS errors during path resolution."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            # Mock Path.cwd() to raise OSError
-            with patch("pathlib.Path.cwd", side_effect=OSError("Mocked OS error")):
-                with pytest.raises(SpecFileError) as exc_info:
-                    resolver.resolve_input_path(".")
+        # Mock Path.cwd() to raise OSError
+        with patch("pathlib.Path.cwd", side_effect=OSError("Mocked OS error")):
+            with pytest.raises(SpecFileError) as exc_info:
+                resolver.resolve_input_path(".")
 
-                assert "Failed to resolve path" in str(exc_info.value)
+            assert "Failed to resolve path" in str(exc_info.value)
 
-    def test_convert_to_spec_directory_path_creates_correct_structure(self) -> None:
+    def test_convert_to_spec_directory_path_creates_correct_structure(
+        self, tmp_path: Path
+    ) -> None:
         """Test conversion of file paths to spec directory paths."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            file_path = Path("src/models.py")
-            result = resolver.convert_to_spec_directory_path(file_path)
+        file_path = Path("src/models.py")
+        result = resolver.convert_to_spec_directory_path(file_path)
 
-            expected = settings.specs_dir / "src" / "models"
-            assert result == expected
+        expected = settings.specs_dir / "src" / "models"
+        assert result == expected
 
-    def test_convert_to_spec_directory_path_handles_nested_files(self) -> None:
+    def test_convert_to_spec_directory_path_handles_nested_files(
+        self, tmp_path: Path
+    ) -> None:
         """Test conversion for nested file structures."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            file_path = Path("src/components/auth/login.tsx")
-            result = resolver.convert_to_spec_directory_path(file_path)
+        file_path = Path("src/components/auth/login.tsx")
+        result = resolver.convert_to_spec_directory_path(file_path)
 
-            expected = settings.specs_dir / "src" / "components" / "auth" / "login"
-            assert result == expected
+        expected = settings.specs_dir / "src" / "components" / "auth" / "login"
+        assert result == expected
 
-    def test_convert_to_spec_directory_path_removes_file_extension(self) -> None:
+    def test_convert_to_spec_directory_path_removes_file_extension(
+        self, tmp_path: Path
+    ) -> None:
         """Test that file extensions are properly removed."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            file_path = Path("test.js")
-            result = resolver.convert_to_spec_directory_path(file_path)
+        file_path = Path("test.js")
+        result = resolver.convert_to_spec_directory_path(file_path)
 
-            expected = settings.specs_dir / "test"
-            assert result == expected
+        expected = settings.specs_dir / "test"
+        assert result == expected
 
-    def test_convert_from_specs_path_handles_absolute_specs_paths(self) -> None:
+    def test_convert_from_specs_path_handles_absolute_specs_paths(
+        self, tmp_path: Path
+    ) -> None:
         """Test conversion from absolute .specs/ paths."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            specs_path = settings.specs_dir / "src" / "models" / "index.md"
-            result = resolver.convert_from_specs_path(specs_path)
+        specs_path = settings.specs_dir / "src" / "models" / "index.md"
+        result = resolver.convert_from_specs_path(specs_path)
 
-            expected = Path("src") / "models" / "index.md"
-            assert result == expected
+        expected = Path("src") / "models" / "index.md"
+        assert result == expected
 
-    def test_convert_from_specs_path_handles_relative_specs_paths(self) -> None:
+    def test_convert_from_specs_path_handles_relative_specs_paths(
+        self, tmp_path: Path
+    ) -> None:
         """Test conversion from relative .specs/ paths."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            specs_path = ".specs/src/models/index.md"
-            result = resolver.convert_from_specs_path(specs_path)
+        specs_path = ".specs/src/models/index.md"
+        result = resolver.convert_from_specs_path(specs_path)
 
-            expected = Path("src") / "models" / "index.md"
-            assert normalize_path_for_comparison(
-                result
-            ) == normalize_path_for_comparison(expected)
+        expected = Path("src") / "models" / "index.md"
+        assert normalize_path_for_comparison(result) == normalize_path_for_comparison(
+            expected
+        )
 
-    def test_convert_from_specs_path_removes_specs_prefix(self) -> None:
+    def test_convert_from_specs_path_removes_specs_prefix(self, tmp_path: Path) -> None:
         """Test that .specs/ prefix is properly removed."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            specs_path = ".specs/file.md"
-            result = resolver.convert_from_specs_path(specs_path)
+        specs_path = ".specs/file.md"
+        result = resolver.convert_from_specs_path(specs_path)
 
-            assert normalize_path_for_comparison(result) == "file.md"
+        assert normalize_path_for_comparison(result) == "file.md"
 
-    def test_convert_from_specs_path_handles_non_specs_paths(self) -> None:
+    def test_convert_from_specs_path_handles_non_specs_paths(
+        self, tmp_path: Path
+    ) -> None:
         """Test handling of paths not in .specs/ context."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            regular_path = "src/models.py"
-            result = resolver.convert_from_specs_path(regular_path)
+        regular_path = "src/models.py"
+        result = resolver.convert_from_specs_path(regular_path)
 
-            assert result == Path("src/models.py")
+        assert result == Path("src/models.py")
 
-    def test_is_within_project_accepts_valid_paths(self) -> None:
+    def test_is_within_project_accepts_valid_paths(self, tmp_path: Path) -> None:
         """Test that valid paths within project are accepted."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            # Test relative path
-            relative_path = Path("src/models.py")
-            assert resolver.is_within_project(relative_path) is True
+        # Test relative path
+        relative_path = Path("src/models.py")
+        assert resolver.is_within_project(relative_path) is True
 
-            # Test absolute path within project
-            absolute_path = root_path / "src" / "models.py"
-            assert resolver.is_within_project(absolute_path) is True
+        # Test absolute path within project
+        absolute_path = root_path / "src" / "models.py"
+        assert resolver.is_within_project(absolute_path) is True
 
-    def test_is_within_project_rejects_external_paths(self) -> None:
+    def test_is_within_project_rejects_external_paths(self, tmp_path: Path) -> None:
         """Test that paths outside project are rejected."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir) / "project"
-            root_path.mkdir()
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path / "project"
+        root_path.mkdir()
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            # Path outside project
-            external_path = Path(temp_dir) / "external.py"
-            assert resolver.is_within_project(external_path) is False
+        # Path outside project
+        external_path = tmp_path / "external.py"
+        assert resolver.is_within_project(external_path) is False
 
-    def test_get_absolute_path_converts_correctly(self) -> None:
+    def test_get_absolute_path_converts_correctly(self, tmp_path: Path) -> None:
         """Test conversion from relative to absolute paths."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            relative_path = Path("src/models.py")
-            result = resolver.get_absolute_path(relative_path)
+        relative_path = Path("src/models.py")
+        result = resolver.get_absolute_path(relative_path)
 
-            expected = root_path / "src" / "models.py"
-            assert result == expected
+        expected = root_path / "src" / "models.py"
+        assert result == expected
 
-    def test_validate_path_exists_passes_for_existing_paths(self) -> None:
+    def test_validate_path_exists_passes_for_existing_paths(
+        self, tmp_path: Path
+    ) -> None:
         """Test that validation passes for existing paths."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            # Create test file
-            test_file = root_path / "test.py"
-            test_file.touch()
+        # Create test file
+        test_file = root_path / "test.py"
+        test_file.touch()
 
-            # Should not raise any exception
-            resolver.validate_path_exists(Path("test.py"))
+        # Should not raise any exception
+        resolver.validate_path_exists(Path("test.py"))
 
-    def test_validate_path_exists_raises_for_missing_paths(self) -> None:
+    def test_validate_path_exists_raises_for_missing_paths(
+        self, tmp_path: Path
+    ) -> None:
         """Test that validation raises for missing paths."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            with pytest.raises(SpecFileError) as exc_info:
-                resolver.validate_path_exists(Path("nonexistent.py"))
+        with pytest.raises(SpecFileError) as exc_info:
+            resolver.validate_path_exists(Path("nonexistent.py"))
 
-            assert "Path does not exist" in str(exc_info.value)
+        assert "Path does not exist" in str(exc_info.value)
 
-    def test_ensure_within_project_with_valid_path(self) -> None:
+    def test_ensure_within_project_with_valid_path(self, tmp_path: Path) -> None:
         """Test _ensure_within_project with valid path."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir)
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
+        root_path = tmp_path
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
 
-            absolute_path = root_path / "src" / "models.py"
-            result = resolver._ensure_within_project(absolute_path)
+        absolute_path = root_path / "src" / "models.py"
+        result = resolver._ensure_within_project(absolute_path)
 
-            expected = Path("src") / "models.py"
-            assert result == expected
+        expected = Path("src") / "models.py"
+        assert result == expected
 
-    def test_ensure_within_project_with_invalid_path(self) -> None:
+    def test_ensure_within_project_with_invalid_path(self, tmp_path: Path) -> None:
         """Test _ensure_within_project with path outside project."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root_path = Path(temp_dir) / "project"
-            root_path.mkdir()
-            settings = SpecSettings(root_path=root_path)
-            resolver = PathResolver(settings=settings)
-
-            external_path = Path(temp_dir) / "external.py"
-
-            with pytest.raises(SpecValidationError) as exc_info:
-                resolver._ensure_within_project(external_path)
-
-            assert "outside project root" in str(exc_info.value)
+        root_path = tmp_path / "project"
+        root_path.mkdir()
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
+
+        external_path = tmp_path / "external.py"
+
+        with pytest.raises(SpecValidationError) as exc_info:
+            resolver._ensure_within_project(external_path)
+
+        assert "outside project root" in str(exc_info.value)
+
+    def test_project_root_resolved_once_per_root_path(self, tmp_path: Path) -> None:
+        """Test that the project root is resolved once and reused."""
+        settings = SpecSettings(root_path=tmp_path)
+        resolver = PathResolver(settings=settings)
+
+        first = resolver._get_resolved_root()
+        assert resolver._get_resolved_root() is first
+
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+        settings.root_path = other_dir
+        assert resolver._get_resolved_root() == other_dir.resolve()
+
+    def test_resolve_input_path_resolves_relative_paths_once(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that relative inputs are not resolved a second time."""
+        root_path = tmp_path.resolve()
+        settings = SpecSettings(root_path=root_path)
+        resolver = PathResolver(settings=settings)
+        resolver._get_resolved_root()  # Prime the root cache
+
+        with patch("pathlib.Path.cwd", return_value=root_path):
+            with patch(
+                "spec_cli.file_system.path_resolver.os.path.realpath",
+                side_effect=os.fspath,
+            ) as mock_realpath:
+                result = resolver.resolve_input_path("src/models.py")
+
+        assert result == Path("src") / "models.py"
+        assert mock_realpath.call_count == 1
+
+    def test_is_within_project_rejects_sibling_with_shared_prefix(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a sibling directory sharing the root's name prefix is outside."""
+        root_path = tmp_path / "project"
+        root_path.mkdir()
+        resolver = PathResolver(settings=SpecSettings(root_path=root_path))
+
+        assert resolver.is_within_project(root_path) is True
+        assert resolver.is_within_project(root_path / "src" / "a.py") is True
+        assert resolver.is_within_project(tmp_path / "project2") is False
@@ -6,28 +6,49 @@ from unittest.mock import Mock, patch
 import pytest
 
 from spec_cli.exceptions import SpecGitError
-from spec_cli.git.operations import GitOperations
+from spec_cli.git.operations import GitOperations, _format_command
+
+
+@pytest.fixture(scope="module")
+def git_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one project root shared by the tests in this module."""
+    return tmp_path_factory.mktemp("git_ops")
 
 
 class TestGitOperations:
     """Tests for GitOperations class."""
 
+    @pytest.fixture(autouse=True)
+    def mock_run(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """Replace subprocess.run so no test starts a real Git process."""
+        mock_run = Mock()
+        mock_run.return_value.returncode = 0
+        monkeypatch.setattr("spec_cli.git.operations.subprocess.run", mock_run)
+        return mock_run
+
     @pytest.fixture
-    def git_ops(self, tmp_path: Path) -> GitOperations:
+    def git_ops(self, git_root: Path) -> GitOperations:
         """Create GitOperations instance for testing."""
-        spec_dir = tmp_path / ".spec"
-        specs_dir = tmp_path / ".specs"
-        index_file = tmp_path / ".spec-index"
+        spec_dir = git_root / ".spec"
+        specs_dir = git_root / ".specs"
+        index_file = git_root / ".spec-index"
 
         return GitOperations(spec_dir, specs_dir, index_file)
 
+    @pytest.fixture
+    def fresh_git_ops(self, tmp_path: Path) -> GitOperations:
+        """Create GitOperations under a per-test root for filesystem checks."""
+        return GitOperations(
+            tmp_path / ".spec", tmp_path / ".specs", tmp_path / ".spec-index"
+        )
+
     def test_git_operations_initialization(
-        self, git_ops: GitOperations, tmp_path: Path
+        self, git_ops: GitOperations, git_root: Path
     ) -> None:
         """Test GitOperations initializes with correct paths."""
-        assert git_ops.spec_dir == tmp_path / ".spec"
-        assert git_ops.specs_dir == tmp_path / ".specs"
-        assert git_ops.index_file == tmp_path / ".spec-index"
+        assert git_ops.spec_dir == git_root / ".spec"
+        assert git_ops.specs_dir == git_root / ".specs"
+        assert git_ops.index_file == git_root / ".spec-index"
 
     def test_git_operations_prepares_environment_correctly(
         self, git_ops: GitOperations
@@ -66,7 +87,6 @@ class TestGitOperations:
 
         assert cmd == expected
 
-    @patch("spec_cli.git.operations.subprocess.run")
     def test_git_operations_executes_commands_successfully(
         self, mock_run: Mock, git_ops: GitOperations
     ) -> None:
@@ -100,7 +120,6 @@ class TestGitOperations:
 
         assert result == mock_process
 
-    @patch("spec_cli.git.operations.subprocess.run")
     def test_git_operations_handles_command_failures(
         self, mock_run: Mock, git_ops: GitOperations
     ) -> None:
@@ -115,10 +134,25 @@ class TestGitOperations:
         with pytest.raises(SpecGitError) as exc_info:
             git_ops.run_git_command(["status"])
 
-        assert "Git command failed" in str(exc_info.value)
-        assert "fatal: not a git repository" in str(exc_info.value)
+        message = str(exc_info.value)
+        assert "Git command failed" in message
+        assert "fatal: not a git repository" in message
+
+    def test_git_operations_failure_message_includes_stderr_then_stdout(
+        self, mock_run: Mock, git_ops: GitOperations
+    ) -> None:
+        """Test that captured output is appended line by line to the error."""
+        mock_run.side_effect = subprocess.CalledProcessError(
+            returncode=1, cmd=["git", "commit"], output="out text", stderr="err text"
+        )
+
+        with pytest.raises(SpecGitError) as exc_info:
+            git_ops.run_git_command(["commit"])
+
+        lines = str(exc_info.value).split("\n")
+        assert lines[0].startswith("Git command failed: git ")
+        assert lines[1:] == ["Stderr: err text", "Stdout: out text"]
 
-    @patch("spec_cli.git.operations.subprocess.run")
     def test_git_operations_handles_missing_git_binary(
         self, mock_run: Mock, git_ops: GitOperations
     ) -> None:
@@ -130,12 +164,12 @@ class TestGitOperations:
         with pytest.raises(SpecGitError) as exc_info:
             git_ops.run_git_command(["status"])
 
-        assert "Git not found" in str(exc_info.value)
-        assert "Please ensure Git is installed and in PATH" in str(exc_info.value)
+        message = str(exc_info.value)
+        assert "Git not found" in message
+        assert "Please ensure Git is installed and in PATH" in message
 
-    @patch("spec_cli.git.operations.subprocess.run")
     def test_git_operations_initializes_repository(
-        self, mock_run: Mock, git_ops: GitOperations, tmp_path: Path
+        self, mock_run: Mock, fresh_git_ops: GitOperations
     ) -> None:
         """Test repository initialization."""
         # Setup mock
@@ -144,6 +178,9 @@ class TestGitOperations:
         mock_process.stdout = "Initialized empty Git repository"
         mock_run.return_value = mock_process
 
+        git_ops = fresh_git_ops
+        assert not git_ops.spec_dir.exists()
+
         # Initialize repository
         git_ops.initialize_repository()
 
@@ -161,9 +198,8 @@ class TestGitOperations:
         # Check that spec directory was created
         assert git_ops.spec_dir.exists()
 
-    @patch("spec_cli.git.operations.subprocess.run")
     def test_git_operations_handles_initialization_failure(
-        self, mock_run: Mock, git_ops: GitOperations
+        self, mock_run: Mock, fresh_git_ops: GitOperations
     ) -> None:
         """Test handling of repository initialization failure."""
         # Setup mock to raise CalledProcessError
@@ -174,12 +210,12 @@ class TestGitOperations:
 
         # Verify exception is raised
         with pytest.raises(SpecGitError) as exc_info:
-            git_ops.initialize_repository()
+            fresh_git_ops.initialize_repository()
 
-        assert "Failed to initialize Git repository" in str(exc_info.value)
-        assert "Permission denied" in str(exc_info.value)
+        message = str(exc_info.value)
+        assert "Failed to initialize Git repository" in message
+        assert "Permission denied" in message
 
-    @patch("spec_cli.git.operations.subprocess.run")
     def test_git_operations_checks_git_availability(
         self, mock_run: Mock, git_ops: GitOperations
     ) -> None:
@@ -196,7 +232,6 @@ class TestGitOperations:
         call_args = mock_run.call_args
         assert call_args[0][0] == ["git", "--version"]
 
-    @patch("spec_cli.git.operations.subprocess.run")
     def test_git_operations_handles_git_unavailable(
         self, mock_run: Mock, git_ops: GitOperations
     ) -> None:
@@ -206,7 +241,6 @@ class TestGitOperations:
 
         assert git_ops.check_git_available() is False
 
-    @patch("spec_cli.git.operations.subprocess.run")
     def test_git_operations_gets_git_version(
         self, mock_run: Mock, git_ops: GitOperations
     ) -> None:
@@ -224,7 +258,6 @@ class TestGitOperations:
         call_args = mock_run.call_args
         assert call_args[0][0] == ["git", "--version"]
 
-    @patch("spec_cli.git.operations.subprocess.run")
     def test_git_operations_handles_version_failure(
         self, mock_run: Mock, git_ops: GitOperations
     ) -> None:
@@ -239,22 +272,16 @@ class TestGitOperations:
         self, mock_logger: Mock, git_ops: GitOperations
     ) -> None:
         """Test that Git command execution is properly logged."""
-        with patch("spec_cli.git.operations.subprocess.run") as mock_run:
-            mock_process = Mock()
-            mock_process.returncode = 0
-            mock_run.return_value = mock_process
-
-            git_ops.run_git_command(["status"])
+        git_ops.run_git_command(["status"])
 
-            # Verify logging calls
-            assert mock_logger.log.called
+        # Verify logging calls
+        assert mock_logger.log.called
 
-            # Check that INFO level logging occurred
-            log_calls = mock_logger.log.call_args_list
-            info_calls = [call for call in log_calls if call[0][0] == "INFO"]
-            assert len(info_calls) >= 2  # At least execution start and completion
+        # Check that INFO level logging occurred
+        log_calls = mock_logger.log.call_args_list
+        info_calls = [call for call in log_calls if call[0][0] == "INFO"]
+        assert len(info_calls) >= 2  # At least execution start and completion
 
-    @patch("spec_cli.git.operations.subprocess.run")
     def test_git_operations_working_directory_setting(
         self, mock_run: Mock, git_ops: GitOperations
     ) -> None:
@@ -269,3 +296,9 @@ class TestGitOperations:
         call_args = mock_run.call_args
         expected_cwd = str(git_ops.specs_dir.parent)
         assert call_args[1]["cwd"] == expected_cwd
+
+    def test_format_command_handles_list_tuple_and_string(self) -> None:
+        """Test that commands render the same for list, tuple and str input."""
+        assert _format_command(["git", "status"]) == "git status"
+        assert _format_command(("git", "status")) == "git status"
+        assert _format_command("git status") == "git status"
@@ -45,61 +45,61 @@ class TestGitPathConverter:
         # Should return path as-is when not under .specs/
         assert result == str(absolute_path)
 
-    def test_path_converter_removes_specs_prefix(
-        self, converter: GitPathConverter
-    ) -> None:
-        """Test removal of .specs/ prefix from paths."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("input_path", "expected"),
+        [
             (".specs/src/main.py", "src/main.py"),
             (".specs/docs/README.md", "docs/README.md"),
             (".specs/test.txt", "test.txt"),
-        ]
-
-        for input_path, expected in test_cases:
-            result = converter.convert_to_git_path(input_path)
-            assert result == expected
-
-    def test_path_converter_handles_windows_separators(
-        self, converter: GitPathConverter
+        ],
+        ids=["nested", "docs", "top-level"],
+    )
+    def test_path_converter_removes_specs_prefix(
+        self, converter: GitPathConverter, input_path: str, expected: str
     ) -> None:
-        """Test handling of Windows-style path separators."""
-        test_cases = [
+        """Test removal of .specs/ prefix from paths."""
+        assert converter.convert_to_git_path(input_path) == expected
+
+    @pytest.mark.parametrize(
+        ("input_path", "expected"),
+        [
             (".specs\\src\\main.py", "src/main.py"),
             (".specs\\docs\\README.md", "docs/README.md"),
             ("src\\utils\\helper.py", "src/utils/helper.py"),
-        ]
-
-        for input_path, expected in test_cases:
-            result = converter.convert_to_git_path(input_path)
-            assert result == expected
+        ],
+        ids=["specs-prefixed", "specs-prefixed-docs", "unprefixed"],
+    )
+    def test_path_converter_handles_windows_separators(
+        self, converter: GitPathConverter, input_path: str, expected: str
+    ) -> None:
+        """Test handling of Windows-style path separators."""
+        assert converter.convert_to_git_path(input_path) == expected
 
+    @pytest.mark.parametrize(
+        "input_path",
+        ["src/main.py", "docs/README.md", "test.txt"],
+        ids=["nested", "docs", "top-level"],
+    )
     def test_path_converter_handles_relative_paths(
-        self, converter: GitPathConverter
+        self, converter: GitPathConverter, input_path: str
     ) -> None:
-        """Test handling of relative paths."""
-        test_cases = [
-            ("src/main.py", "src/main.py"),
-            ("docs/README.md", "docs/README.md"),
-            ("test.txt", "test.txt"),
-        ]
+        """Test that relative paths are returned unchanged."""
+        assert converter.convert_to_git_path(input_path) == input_path
 
-        for input_path, expected in test_cases:
-            result = converter.convert_to_git_path(input_path)
-            assert result == expected
-
-    def test_path_converter_converts_from_git_context(
-        self, converter: GitPathConverter
-    ) -> None:
-        """Test conversion from Git work tree context to .specs/ prefixed paths."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("git_path", "expected"),
+        [
             ("src/main.py", Path(".specs/src/main.py")),
             ("docs/README.md", Path(".specs/docs/README.md")),
             ("test.txt", Path(".specs/test.txt")),
-        ]
-
-        for git_path, expected in test_cases:
-            result = converter.convert_from_git_path(git_path)
-            assert result == expected
+        ],
+        ids=["nested", "docs", "top-level"],
+    )
+    def test_path_converter_converts_from_git_context(
+        self, converter: GitPathConverter, git_path: str, expected: Path
+    ) -> None:
+        """Test conversion from Git work tree context to .specs/ prefixed paths."""
+        assert converter.convert_from_git_path(git_path) == expected
 
     def test_path_converter_handles_already_prefixed_from_git(
         self, converter: GitPathConverter
@@ -159,20 +159,21 @@ class TestGitPathConverter:
         for path in not_under_specs:
             assert converter.is_under_specs_dir(path) is False
 
-    def test_path_converter_normalizes_path_separators(
-        self, converter: GitPathConverter
-    ) -> None:
-        """Test normalization of path separators to forward slashes."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("input_path", "expected"),
+        [
             ("src\\main.py", "src/main.py"),
             ("docs\\sub\\README.md", "docs/sub/README.md"),
-            ("src/main.py", "src/main.py"),  # Already normalized
+            ("src/main.py", "src/main.py"),
             ("mixed\\path/separators.txt", "mixed/path/separators.txt"),
-        ]
-
-        for input_path, expected in test_cases:
-            result = converter.normalize_path_separators(input_path)
-            assert result == expected
+        ],
+        ids=["windows", "windows-nested", "already-normalized", "mixed"],
+    )
+    def test_path_converter_normalizes_path_separators(
+        self, converter: GitPathConverter, input_path: str, expected: str
+    ) -> None:
+        """Test normalization of path separators to forward slashes."""
+        assert converter.normalize_path_separators(input_path) == expected
 
     def test_path_converter_provides_conversion_info(
         self, converter: GitPathConverter, tmp_path: Path
@@ -262,3 +263,22 @@ class TestGitPathConverter:
             # Should result in .specs/ prefixed version
             expected = Path(".specs") / converter.convert_to_git_path(original)
             assert specs_path == expected
+
+    def test_path_converter_converts_batches_in_order(
+        self, converter: GitPathConverter, tmp_path: Path
+    ) -> None:
+        """Test that batch conversion matches per-path conversion."""
+        paths: List[Union[str, Path]] = [
+            tmp_path / ".specs" / "src" / "main.py",
+            ".specs/docs/index.md",
+            "lib\\util.py",
+            tmp_path / "other" / "file.py",
+            str(tmp_path / ".specs" / "docs" / "api.md"),
+            f"{tmp_path}/.specs//nested/./notes.md",
+        ]
+
+        result = converter.convert_to_git_paths(paths)
+
+        assert result == [converter.convert_to_git_path(p) for p in paths]
+        assert result[:3] == ["src/main.py", "docs/index.md", "lib/util.py"]
+        assert result[4:] == ["docs/api.md", "nested/notes.md"]
@@ -196,6 +196,16 @@ class TestSpecGitRepository:
 
         assert repository.is_initialized() is False
 
+    def test_spec_git_repository_detects_objects_file_as_uninitialized(
+        self, repository: SpecGitRepository, tmp_path: Path
+    ) -> None:
+        """Test that an objects file (not directory) is not treated as a repo."""
+        spec_dir = tmp_path / ".spec"
+        spec_dir.mkdir(exist_ok=True)
+        (spec_dir / "objects").write_text("not a directory")
+
+        assert repository.is_initialized() is False
+
     def test_spec_git_repository_initializes_repository(
         self, repository: SpecGitRepository, tmp_path: Path
     ) -> None:
@@ -82,8 +82,7 @@ class TestDebugLogger:
                 assert mock_info.call_count == 2
 
                 # Check that duration was logged
-                start_call = mock_info.call_args_list[0][0][0]
-                end_call = mock_info.call_args_list[1][0][0]
+                start_call, end_call = (call[0][0] for call in mock_info.call_args_list)
 
                 assert "Starting operation: test_operation" in start_call
                 assert "Completed operation: test_operation" in end_call
@@ -179,3 +178,36 @@ class TestDebugLogger:
                 assert "operation=file_read" in call_args
                 assert "path=/tmp/test.txt" in call_args
                 assert "error_type=ValueError" in call_args
+
+    def test_debug_logger_is_enabled_for_respects_configured_level(self) -> None:
+        """Test that is_enabled_for reflects the enabled flag and level."""
+        with patch.dict(
+            os.environ, {"SPEC_DEBUG": "1", "SPEC_DEBUG_LEVEL": "WARNING"}, clear=True
+        ):
+            logger = DebugLogger()
+            assert logger.is_enabled_for("DEBUG") is False
+            assert logger.is_enabled_for("INFO") is False
+            assert logger.is_enabled_for("WARNING") is True
+            assert logger.is_enabled_for("error") is True
+
+        with patch.dict(os.environ, {"SPEC_DEBUG": "0"}, clear=True):
+            logger = DebugLogger()
+            assert logger.is_enabled_for("ERROR") is False
+
+    def test_debug_logger_log_error_context_precedence(self) -> None:
+        """Test that explicit context overrides SpecError and base error info."""
+        with patch.dict(os.environ, {"SPEC_DEBUG": "1"}):
+            logger = DebugLogger()
+
+            error = SpecGitError("Failed", {"source": "error", "stage": "load"})
+
+            with patch.object(logger.logger, "error") as mock_error:
+                logger.log_error(error, context={"source": "caller"})
+
+                call_args = mock_error.call_args[0][0]
+                assert "source=caller" in call_args
+                assert "source=error" not in call_args
+                assert "stage=load" in call_args
+                assert call_args.index("error_type=SpecGitError") < call_args.index(
+                    "source=caller"
+                )
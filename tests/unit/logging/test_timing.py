@@ -123,8 +123,7 @@ class TestTimerFunction:
         # Should call log twice (start and end)
         assert mock_logger.log.call_count == 2
 
-        start_call = mock_logger.log.call_args_list[0]
-        end_call = mock_logger.log.call_args_list[1]
+        start_call, end_call = mock_logger.log.call_args_list
 
         assert start_call[0] == ("INFO", "Starting: test_operation")
         assert end_call[0][0] == "INFO"
@@ -187,3 +186,14 @@ class TestTimingResult:
 
         assert result.success is False
         assert result.error == "Something went wrong"
+
+    def test_timing_result_is_immutable_and_hashable(self) -> None:
+        """Test that TimingResult is frozen and usable as a dict key."""
+        from dataclasses import FrozenInstanceError
+
+        result = TimingResult("op", 1.0, 0.0, 0.001)
+
+        with pytest.raises(FrozenInstanceError):
+            result.success = False  # type: ignore[misc]
+
+        assert {result: "cached"}[TimingResult("op", 1.0, 0.0, 0.001)] == "cached"
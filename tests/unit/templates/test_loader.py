@@ -56,6 +56,32 @@ class TestTemplateLoader:
         assert "Test index template" in config.index
         assert "Test history template" in config.history
 
+    def test_template_loader_reuses_parse_until_file_changes(
+        self, temp_dir: Path, mock_settings: Mock
+    ) -> None:
+        """Test that an unchanged template file is parsed only once."""
+        template_file = mock_settings.template_file
+        template_data = {
+            "version": "2.0",
+            "description": "First",
+            "index": "# {{filename}}\n\n**Location**: {{filepath}}\n\nTest index template with enough content for validation\n\n## Purpose\n{{purpose}}\n\n## Overview\n{{overview}}\n\n## Usage\n{{example_usage}}",
+            "history": "# History for {{filename}}\n\n**Location**: {{filepath}}\n\nTest history template with enough content\n\n## {{date}} - Initial Creation\n{{context}}",
+        }
+        template_file.write_text(yaml.dump(template_data))
+
+        loader = TemplateLoader(mock_settings)
+        with patch(
+            "spec_cli.templates.loader.yaml.safe_load", wraps=yaml.safe_load
+        ) as mock_safe_load:
+            assert loader.load_template().description == "First"
+            assert loader.load_template().description == "First"
+            assert mock_safe_load.call_count == 1
+
+            template_data["description"] = "Second file"
+            template_file.write_text(yaml.dump(template_data))
+            assert loader.load_template().description == "Second file"
+            assert mock_safe_load.call_count == 2
+
     def test_template_loader_uses_defaults_when_file_missing(
         self, mock_settings: Mock
     ) -> None:
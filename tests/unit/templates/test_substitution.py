@@ -173,6 +173,17 @@ class TestTemplateAnalysis:
         assert len(issues2) > 0
         assert "empty variable" in " ".join(issues2).lower()
 
+    def test_template_syntax_validation_follows_changed_delimiters(self) -> None:
+        """Test that validation uses the current delimiters."""
+        substitution = TemplateSubstitution()
+        substitution.change_delimiters("[[", "]]")
+
+        assert substitution.validate_template_syntax("Hello [[name]]") == []
+
+        issues = substitution.validate_template_syntax("Hello [[ ]] and [[a-b]]")
+        assert "Found 1 empty variable placeholders" in issues
+        assert "Invalid variable names: [' ', 'a-b']" in issues
+
     def test_variable_extraction_from_template(self) -> None:
         """Test extraction of variables from templates."""
         substitution = TemplateSubstitution()
@@ -77,6 +77,17 @@ class TestErrorPanel:
 
         assert panel._get_error_title(error) == "[error]Error[/error]"
 
+    def test_get_error_title_subclass_prefers_spec_error_style(self) -> None:
+        """Test that SpecError styling wins for subclasses of both families."""
+
+        class MixedError(SpecError, ValueError):
+            pass
+
+        error = MixedError("Mixed error")
+        panel = ErrorPanel(error)
+
+        assert panel._get_error_title(error) == "[error]MixedError[/error]"
+
     def test_create_panel_basic(self) -> None:
         """Test basic panel creation."""
         error = ValueError("Test error message")
@@ -108,6 +119,17 @@ class TestErrorPanel:
         assert context is not None
         assert "/path/to/missing/file.txt" in context
 
+    def test_get_error_context_file_not_found_without_filename(self) -> None:
+        """Test error context falls back when FileNotFoundError has no filename."""
+        error = FileNotFoundError("No such file")
+        panel = ErrorPanel(error)
+
+        context = panel._get_error_context()
+
+        assert context is not None
+        assert "Unknown file" in context
+        assert "None" not in context
+
     def test_get_error_context_permission_error(self) -> None:
         """Test error context for PermissionError."""
         error = PermissionError("Permission denied")